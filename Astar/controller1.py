@@ -12,166 +12,42 @@
 
 # A* Search
 
-import Queue as Q
+import os
+import sys
 
-class node:
-	'''
-		This is the class for the node which represents a particular position on the board
-		where   x is the x -cordinate
-				y is the y -cordinate
-				p is pointing to the parent of this node
-				f is the f(n) which is equal to h(n) + g(n) for A* search method
-				h(n) is the heuristic function which is equal to manhettan distance and it is admissible heuristic function
-				g is the cost of path from musketeer to this node 
-	'''
-	def __init__(self,xc,yc,p,fx,fy,g):
-		self.x=xc
-		self.y=yc
-		self.p=p 				# This is a pointer to the parent of this node
-		self.f=abs(fx-xc)+abs(fy-yc)+g	
-		self.g=g
-
-	def __cmp__(self,other):
-		'''
-			This is the comparison function
-		'''
-		if self.f>=other.f:
-			return 1
-		else:
-			return -1
+# the search engine lives in the treasurehunt package at the root of the repository
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
 
+from treasurehunt import engine
+from treasurehunt.trace import SearchTrace
 
-def expand(en,fl,es,mat,fx,fy):
-	'''
-		This function expands the given node en and adds the children of en into the frontier list fl if they are not present 
-		in the frontier list fl or the explored nodes set es.
-	'''
-
-	m=len(mat)
-	n=len(mat[0])
+STRATEGY='astar'
+BIDIRECTIONAL='astar-bi'
 
-	x=en.x
-	y=en.y
 
-	y-=1
-	
-	if y>=0 and not any(a.x==x and a.y==y for a in fl.queue) and not any(a.x==x and a.y==y for a in es) and (mat[x][y]==2 or mat[x][y]==3):
-		fl.put(node(x,y,en,fx,fy,en.g+1))
-	x+=1
-	y+=1
-	
-	if x<m and y<n and not any(a.x==x and a.y==y for a in fl.queue) and not any(a.x==x and a.y==y for a in es) and (mat[x][y]==2 or mat[x][y]==3):
-		fl.put(node(x,y,en,fx,fy,en.g+1))
-	y+=1
-	x-=1
-	
-	if y<n and x>=0 and not any(a.x==x and a.y==y for a in fl.queue) and not any(a.x==x and a.y==y for a in es) and (mat[x][y]==2 or mat[x][y]==3):
-		fl.put(node(x,y,en,fx,fy,en.g+1))
-	y-=1
-	x-=1
-
-	if y>=0 and x>=0 and not any(a.x==x and a.y==y for a in fl.queue) and not any(a.x==x and a.y==y for a in es) and (mat[x][y]==2 or mat[x][y]==3):
-		fl.put(node(x,y,en,fx,fy,en.g+1))
-
-	return fl
-
-
-def singleAgentSearch(board):
+def singleAgentSearch(board,compact=False,multisource=False,heuristic='manhattan',bidirectional=False,prune=False,processes=None):
 	'''
 		This function implements the A* Search
+		If compact is True, searchQueue is returned as a SearchTrace (push/pop events with keyframes) rather than as
+		a full copy of the frontier list for every iteration.
+		If multisource is True, all musketeers are searched in one pass and only the part of the search reached from
+		the winning musketeer is returned.
+		If prune is True, dead ends which can not be on any path are removed from the board before the search.
+		If processes is given, the searches from the musketeers run in parallel in up to that many worker processes.
+		If bidirectional is True, a second search grows from the diamond and the two stop when they meet; both are
+		shown in exploredNodes and searchQueue.
+		heuristic selects the estimate of the distance to the diamond, by name (see treasurehunt.HEURISTICS) or as
+		a function.
 	'''
+	strategy=BIDIRECTIONAL if bidirectional else STRATEGY
+	return engine.singleAgentSearch(board,strategy,compact,multisource,heuristic,prune=prune,processes=processes)
 
-	mat=board
-	m=len(mat)
-	n=len(mat[0])
-	
-	muske=[]
-
-	for x in range(0,m):
-		for y in range(0,n):
-			if mat[x][y]==3:
-				fx=x
-				fy=y
 
-	for x in range(0,m):
-		for y in range(0,n):
-			if mat[x][y]==1:
-				muske.append(node(x,y,None,fx,fy,0))
-
-	num=len(muske)      # num is the number of musketers
-	
-	EN=[]
-	SQ=[]
-	SP=[]
-	for i in range(0,num):
-
-		musk=muske[i]
-		es=[]
-		fl=Q.PriorityQueue()
-		fl.put(musk)
-		sq=[]
-		s=[]
-		while(1):
-			if(fl.empty()):
-				break
-			en=fl.get()
-			es.append(en)
-			if mat[en.x][en.y]==3:
-				break
-			fl=expand(en,fl,es,mat,fx,fy)
-			s=fl.queue
-		
-			t=[]
-			for i in range(len(s)):
-				t.append([s[i].x,s[i].y])
-			 
-			sq.append(t)
-		s=fl.queue
-		
-		t=[]
-		for i in range(len(s)):
-			t.append([s[i].x,s[i].y])
-		
-		sq.append(t)
-		est=[]
-		for i in range(0,len(es)):
-			est.append([es[i].x,es[i].y])
-		
-		path=[]
-		par=en.p
-		path.append([en.x,en.y])
-		while(par):
-			path.append([par.x,par.y])
-			par=par.p
-
-		path.reverse()
-
-		if mat[en.x][en.y]==3:
-			EN.append(est)
-			SQ.append(sq)
-			SP.append(path)
-
-	# Returning the shortest path which is shortest among all the available musketers
-
-	number=len(EN)
-	mini=0
-	if number>=2:
-		if len(SP[0])<=len(SP[1]):
-			mini=0
-		else:
-			mini=1
-
-	if number==3:
-		if len(SP[2])<=len(SP[mini]):
-			mini=2
-			
-	if number==0:
-		exploredNodes=[]
-		searchQueue=[]
-		shortestPath=[]
-	else:
-		exploredNodes = EN[mini]
-		searchQueue  = SQ[mini]
-		shortestPath = SP[mini]
-
-	return (exploredNodes,searchQueue,shortestPath)
+def findShortestPath(board,multisource=False,heuristic='manhattan',bidirectional=False,prune=False,processes=None):
+	'''
+		This function runs the A* Search without recording the explored nodes or the frontier list.
+		It returns (shortestPath,stats) where stats counts the searches run, the nodes expanded and generated and
+		the dead end cells pruned.
+	'''
+	strategy=BIDIRECTIONAL if bidirectional else STRATEGY
+	return engine.findShortestPath(board,strategy,multisource,heuristic,prune=prune,processes=processes)
@@ -11,160 +11,50 @@
 
 # Breadth First Search
 
-class node:
-	'''
-		This is the class for the node which represents a particular position on the board
-		where   x is the x -cordinate
-				y is the y -cordinate
-				p is pointing to the parent of this node
-	'''
-	def __init__(self,xc,yc,p=None):
-		self.x=xc
-		self.y=yc
-		self.p=p		# This is a pointer to the parent of this node
-
-
-class Queue:
-	'''
-		This is a First in First Out (FIFO) Queue
-	'''
-	def __init__(self):
-		self.list=[]
-
-	def isEmpty(self):
-		return self.list==[]
-
-	def enqueue(self,node):
-		self.list.insert(0,node)
-
-	def dequeue(self):
-		return self.list.pop()
-
-	def size(self):
-		return len(self.list)
-
-def expand(en,fl,es,mat):
-	'''
-		This function expands the given node en and adds the children of en into the frontier list fl if they are not present 
-		in the frontier list fl or the explored nodes set es.
-	'''
-	m=len(mat)
-	n=len(mat[0])
+import os
+import sys
 
-	x=en.x
-	y=en.y
+# the search engine lives in the treasurehunt package at the root of the repository
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
 
-	y-=1
-	if y>=0 and not any(a.x==x and a.y==y for a in fl.list) and not any(a.x==x and a.y==y for a in es) and (mat[x][y]==2 or mat[x][y]==3):
-		fl.enqueue(node(x,y,en))
-	x+=1
-	y+=1
-	
-	if x<m and y<n and not any(a.x==x and a.y==y for a in fl.list) and not any(a.x==x and a.y==y for a in es) and (mat[x][y]==2 or mat[x][y]==3):
-		fl.enqueue(node(x,y,en))
-	y+=1
-	x-=1
-	
-	if y<n and x>=0 and not any(a.x==x and a.y==y for a in fl.list) and not any(a.x==x and a.y==y for a in es) and (mat[x][y]==2 or mat[x][y]==3):
-		fl.enqueue(node(x,y,en))
-	y-=1
-	x-=1
-	
-	if y>=0 and x>=0 and not any(a.x==x and a.y==y for a in fl.list) and not any(a.x==x and a.y==y for a in es) and (mat[x][y]==2 or mat[x][y]==3):
-		fl.enqueue(node(x,y,en))
+from treasurehunt import engine
+from treasurehunt.trace import SearchTrace
 
-	return fl
+STRATEGY='bfs'
+BIDIRECTIONAL='bfs-bi'
+WAVEFRONT='wavefront'
+BITBOARD='bitboard'
+FIELD='field'
 
 
-def singleAgentSearch(board):
+def singleAgentSearch(board,compact=False,multisource=False,bidirectional=False,prune=False,wavefront=False,bitboard=False,field=False,processes=None):
 	'''
 		This function implements the Breadth First Search
-	'''
-
-	mat=board
-	m=len(mat)
-	n=len(mat[0])
-	
-	muske=[]
-	for x in range(0,m):
-		for y in range(0,n):
-			if mat[x][y]==1:
-				muske.append(node(x,y))
-
-	num=len(muske)      # num is the number of musketers
-	
-	EN=[]
-	SQ=[]
-	SP=[]
-	for i in range(0,num):
-
-		musk=muske[i]
-		es=[]
-		fl=Queue()
-		fl.enqueue(musk)
-		sq=[]
-		s=[]
-		while(1):
-			if(fl.isEmpty()):
-				break
-			en=fl.dequeue()
-			es.append(en)
-			if mat[en.x][en.y]==3:
-				break
-			fl=expand(en,fl,es,mat)
-			s=fl.list[:]
-			s.reverse()
-			t=[]
-			for i in range(len(s)):
-				t.append([s[i].x,s[i].y])
-	 
-			sq.append(t)
-		s=fl.list[:]
-		s.reverse()
-		t=[]
-		for i in range(len(s)):
-			t.append([s[i].x,s[i].y]) 
-		sq.append(t)
-		est=[]
-		for i in range(0,len(es)):
-			est.append([es[i].x,es[i].y])
-		
-		path=[]
-		par=en.p
-		path.append([en.x,en.y])
-		while(par!=None):
-			path.append([par.x,par.y])
-			par=par.p
-
-		path.reverse()
-		
-		if mat[en.x][en.y]==3:
-			EN.append(est)
-			SQ.append(sq)
-			SP.append(path)
-
-	# Returning the shortest path which is shortest among all the available musketers
-
-	number=len(EN)
-	mini=0
-	if number>=2:
-		if len(SP[0])<=len(SP[1]):
-			mini=0
-		else:
-			mini=1
-
-	if number==3:
-		if len(SP[2])<=len(SP[mini]):
-			mini=2
-
-	if number==0:
-		exploredNodes=[]
-		searchQueue=[]
-		shortestPath=[]
-	else:
-		exploredNodes = EN[mini]
-		searchQueue  = SQ[mini]
-		shortestPath = SP[mini]
-
-	return (exploredNodes,searchQueue,shortestPath)
-
+		If compact is True, searchQueue is returned as a SearchTrace (push/pop events with keyframes) rather than as
+		a full copy of the frontier list for every iteration.
+		If multisource is True, all musketeers are searched in one pass and only the part of the search reached from
+		the winning musketeer is returned.
+		If prune is True, dead ends which can not be on any path are removed from the board before the search.
+		If processes is given, the searches from the musketeers run in parallel in up to that many worker processes.
+		If bidirectional is True, a second search grows from the diamond and the two stop when they meet; both are
+		shown in exploredNodes and searchQueue.
+		If wavefront is True, the search advances a whole layer at a time with NumPy (which must be installed); the
+		layers are shown one cell after another, with the rest of the layer and the next one as the frontier.
+		If bitboard is True, the same layer at a time search runs over the board kept as Python integer bit sets,
+		with no NumPy needed.
+		If field is True, the path is read off the distance from every cell to the diamond, computed once per board,
+		wherever its musketeers stand, and kept for later queries on it (see treasurehunt/field.py); only the walk
+		down the path is shown.
+	'''
+	strategy=FIELD if field else BITBOARD if bitboard else WAVEFRONT if wavefront else BIDIRECTIONAL if bidirectional else STRATEGY
+	return engine.singleAgentSearch(board,strategy,compact,multisource,prune=prune,processes=processes)
+
+
+def findShortestPath(board,multisource=False,bidirectional=False,prune=False,wavefront=False,bitboard=False,field=False,processes=None):
+	'''
+		This function runs the Breadth First Search without recording the explored nodes or the frontier list.
+		It returns (shortestPath,stats) where stats counts the searches run, the nodes expanded and generated and
+		the dead end cells pruned.
+	'''
+	strategy=FIELD if field else BITBOARD if bitboard else WAVEFRONT if wavefront else BIDIRECTIONAL if bidirectional else STRATEGY
+	return engine.findShortestPath(board,strategy,multisource,prune=prune,processes=processes)
@@ -358,7 +358,8 @@ def higlightNodes(board,visitedNodes,neighborNodes,moves,clickCount):
 		Args:
 			board (list of lists) : list of lists having the board state (2-d lists of int type)
 			visitedNodes (list of type:[x1,y1]) : Contains list of nodes visited
-			neighborNodes (list of lists) : Contains list of lists (BFS/DFS queue) at each iteration of the algorithm
+			neighborNodes (list of lists) : Contains list of lists (BFS/DFS queue) at each iteration of the algorithm.
+							It may also be a controller1.SearchTrace, which rebuilds the queue of an iteration on demand.
 			moves (list of type : [x1,y1]) : Contains the path from one of the musketeers to the diamond
 			clickCount (int) : stores the number of clicks on next/prev button.
 
@@ -375,19 +376,22 @@ def higlightNodes(board,visitedNodes,neighborNodes,moves,clickCount):
 		makeText(str(clickCount+1),WHITE,730,280)
 
 		pygame.draw.rect(DISPLAYWINDOW,BUTTONCOLOR,(700,350,70,30))     # rectangular box to display the count of nodes to be explored
-		makeText(str(len(neighborNodes[clickCount])),WHITE,730,350)
+		frontier = neighborNodes[clickCount]    # queue after this iteration, fetched once as a SearchTrace rebuilds it
+		makeText(str(len(frontier)),WHITE,730,350)
 
 	
-		clickCount = min(clickCount,len(visitedNodes)-1) # restricting the clickcount variable value to equal to number of lists in visitedNodes
+		if clickCount > len(visitedNodes)-1: # restricting the clickcount variable value to equal to number of lists in visitedNodes
+			clickCount = len(visitedNodes)-1
+			frontier = neighborNodes[clickCount]
 		
 		for i in range(clickCount+1):   # highlights the visited nodes as green
 			x = visitedNodes[i][0]
 			y = visitedNodes[i][1]
 			drawCell(x,y,board[x][y],1)
 			
-		for i in range(len(neighborNodes[clickCount])): # highlight the nodes to be explored as blue
-			p = neighborNodes[clickCount][i][0]
-			q = neighborNodes[clickCount][i][1]
+		for i in range(len(frontier)): # highlight the nodes to be explored as blue
+			p = frontier[i][0]
+			q = frontier[i][1]
 			drawCell(p,q,board[p][q],2)
 
 		
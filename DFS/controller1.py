@@ -11,164 +11,35 @@
 
 # Depth First Search
 
-class node:
-	'''
-		This is the class for the node which represents a particular position on the board
-		where   x is the x -cordinate
-				y is the y -cordinate
-				p is pointing to the parent of this node
-	'''
-	def __init__(self,xc,yc,p=None):
-		self.x=xc
-		self.y=yc
-		self.p=p		# This is a pointer to the parent of this node
-
+import os
+import sys
 
-class Queue:
-	'''
-		This is a Last in First Out (LIFO) Queue
-	'''
-	def __init__(self):
-		self.list=[]
+# the search engine lives in the treasurehunt package at the root of the repository
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
 
-	def isEmpty(self):
-		return self.list==[]
+from treasurehunt import engine
+from treasurehunt.trace import SearchTrace
 
-	def enqueue(self,node):
-		self.list.insert(0,node)
+STRATEGY='dfs'
 
-	def dequeue(self):
-		return self.list.pop(0)
- 
-	def size(self):
-		return len(self.list)
 
-def expand(en,fl,es,mat):
+def singleAgentSearch(board,compact=False,multisource=False,prune=False,processes=None):
 	'''
-		This function expands the given node en and adds the children of en into the frontier list fl if they are not present 
-		in the frontier list fl or the explored nodes set es.
+		This function implements the Depth First Search
+		If compact is True, searchQueue is returned as a SearchTrace (push/pop events with keyframes) rather than as
+		a full copy of the frontier list for every iteration.
+		If multisource is True, all musketeers are searched in one pass and only the part of the search reached from
+		the winning musketeer is returned.
+		If prune is True, dead ends which can not be on any path are removed from the board before the search.
+		If processes is given, the searches from the musketeers run in parallel in up to that many worker processes.
 	'''
+	return engine.singleAgentSearch(board,STRATEGY,compact,multisource,prune=prune,processes=processes)
 
-	m=len(mat)
-	n=len(mat[0])
 
-	x=en.x
-	y=en.y
-
-	x-=1
-	
-	if x>=0 and not any(a.x==x and a.y==y for a in fl.list) and not any(a.x==x and a.y==y for a in es) and (mat[x][y]==2 or mat[x][y]==3):
-		fl.enqueue(node(x,y,en))
-	x+=1
-	y+=1
-	
-	if x<n and y<n and not any(a.x==x and a.y==y for a in fl.list) and not any(a.x==x and a.y==y for a in es) and (mat[x][y]==2 or mat[x][y]==3):
-		fl.enqueue(node(x,y,en))
-	x+=1
-	y-=1
-	
-	if x<m and y>=0 and not any(a.x==x and a.y==y for a in fl.list) and not any(a.x==x and a.y==y for a in es) and (mat[x][y]==2 or mat[x][y]==3):
-		fl.enqueue(node(x,y,en))
-	y-=1
-	x-=1
-	
-	if y>=0 and x>=0 and not any(a.x==x and a.y==y for a in fl.list) and not any(a.x==x and a.y==y for a in es) and (mat[x][y]==2 or mat[x][y]==3):
-		fl.enqueue(node(x,y,en))
-
-	return fl
-
-
-def singleAgentSearch(board):
+def findShortestPath(board,multisource=False,prune=False,processes=None):
 	'''
-		This function implements the Depth First Search
+		This function runs the Depth First Search without recording the explored nodes or the frontier list.
+		It returns (shortestPath,stats) where stats counts the searches run, the nodes expanded and generated and
+		the dead end cells pruned.
 	'''
-
-	mat=board
-	m=len(mat)
-	n=len(mat[0])
-	
-	muske=[]
-	for x in range(0,m):
-		for y in range(0,n):
-			if mat[x][y]==1:
-				muske.append(node(x,y))
-
-	num=len(muske)      # num is the number of musketers
-	
-	EN=[]
-	SQ=[]
-	SP=[]
-	for i in range(0,num):
-
-		musk=muske[i]
-		es=[]
-		fl=Queue()
-		fl.enqueue(musk)
-		sq=[]
-		s=[]
-		while(1):
-			if(fl.isEmpty()):
-				break
-			en=fl.dequeue()
-			es.append(en)
-			if mat[en.x][en.y]==3:
-				break
-			fl=expand(en,fl,es,mat)
-			s=fl.list[:]
-			s.reverse()
-			t=[]
-			for i in range(len(s)):
-				t.append([s[i].x,s[i].y])
-			 
-			sq.append(t)
-		s=fl.list[:]
-		s.reverse()
-		t=[]
-		for i in range(len(s)):
-			t.append([s[i].x,s[i].y])
-	 
-		sq.append(t)
-		est=[]
-		for i in range(0,len(es)):
-			est.append([es[i].x,es[i].y])
-		
-		path=[]
-		par=en.p
-		path.append([en.x,en.y])
-		while(par!=None):
-			path.append([par.x,par.y])
-			par=par.p
-
-		path.reverse()
-
-		if mat[en.x][en.y]==3:
-			EN.append(est)
-			SQ.append(sq)
-			SP.append(path)
-
-
-	# Returning the shortest path which is shortest among all the available musketers
-
-	number=len(EN)
-	mini=0
-	if number>=2:
-		if len(SP[0])<=len(SP[1]):
-			mini=0
-		else:
-			mini=1
-
-	if number==3:
-		if len(SP[2])<=len(SP[mini]):
-			mini=2
-
-	if number==0:
-		exploredNodes=[]
-		searchQueue=[]
-		shortestPath=[]
-	else:
-		exploredNodes = EN[mini]
-		searchQueue  = SQ[mini]
-		shortestPath = SP[mini]
-
-	return (exploredNodes,searchQueue,shortestPath)
-
+	return engine.findShortestPath(board,STRATEGY,multisource,prune=prune,processes=processes)
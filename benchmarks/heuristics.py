@@ -0,0 +1,76 @@
+'''
+	heuristics.py compares the heuristics of treasurehunt.HEURISTICS on a corpus of boards. For every informed
+	strategy and heuristic it prints the nodes expanded and generated, the total length of the paths found and the
+	time taken.
+
+	Usage:
+		python benchmarks/heuristics.py [board files] [--random N] [--seed S] [--repeat R]
+
+	Board files are in the format of input.txt; without any, the input.txt of the Astar directory is used.
+	--random adds N random boards to the corpus, and --repeat queries every board R times, as when the same board
+	is searched again and again (heuristics such as alt only pay for their precomputation once per board).
+'''
+
+from __future__ import print_function
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT=os.path.join(os.path.dirname(os.path.abspath(__file__)),'..')
+sys.path.insert(0,ROOT)
+from treasurehunt import engine, HEURISTICS
+from treasurehunt.board import readBoard
+
+STRATEGIES=['bestfirst','astar','idastar']
+
+
+def randomBoard(rnd):
+	'''
+		Returns a random board of up to 30x30 cells with mostly soldiers, a diamond and one to three musketeers
+	'''
+	m=rnd.randint(5,30)
+	n=rnd.randint(5,30)
+	board=[[2 if rnd.random()<0.7 else 0 for y in range(n)] for x in range(m)]
+	cells=[(x,y) for x in range(m) for y in range(n)]
+	rnd.shuffle(cells)
+	board[cells[0][0]][cells[0][1]]=3
+	for (x,y) in cells[1:1+rnd.randint(1,3)]:
+		board[x][y]=1
+	return board
+
+
+def main():
+	parser=argparse.ArgumentParser(description='Compare the heuristics of the informed searches')
+	parser.add_argument('boards',nargs='*',help='board files in the format of input.txt')
+	parser.add_argument('--random',type=int,default=0,help='number of random boards to add')
+	parser.add_argument('--seed',type=int,default=0,help='seed of the random boards')
+	parser.add_argument('--repeat',type=int,default=1,help='number of times every board is queried')
+	args=parser.parse_args()
+
+	paths=args.boards or [os.path.join(ROOT,'Astar','input.txt')]
+	boards=[readBoard(path) for path in paths]
+	rnd=random.Random(args.seed)
+	boards+=[randomBoard(rnd) for i in range(args.random)]
+
+	print('%d boards' % len(boards))
+	print('%-10s %-10s %10s %10s %8s %8s' % ('strategy','heuristic','expanded','generated','length','seconds'))
+	for strategy in STRATEGIES:
+		for name in sorted(HEURISTICS):
+			expanded=0
+			generated=0
+			length=0
+			start=time.time()
+			for board in boards*args.repeat:
+				(path,stats)=engine.findShortestPath(board,strategy,heuristic=name)
+				expanded+=stats['expanded']
+				generated+=stats['generated']
+				length+=len(path)
+			elapsed=time.time()-start
+			print('%-10s %-10s %10d %10d %8d %8.3f' % (strategy,name,expanded,generated,length,elapsed))
+
+
+if __name__=='__main__':
+	main()
@@ -0,0 +1,52 @@
+'''
+	boards.py makes the random boards the tests run the searches on
+'''
+
+import os
+import sys
+
+# the tests import the treasurehunt package from the root of the repository, as the controllers do
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+
+
+def randomBoard(rnd,density=0.7):
+	'''
+		Returns a random board of up to 20x20 cells, each a soldier with probability density, with a diamond and one
+		to three musketeers
+	'''
+	m=rnd.randint(2,20)
+	n=rnd.randint(2,20)
+	board=[[2 if rnd.random()<density else 0 for y in range(n)] for x in range(m)]
+	cells=[(x,y) for x in range(m) for y in range(n)]
+	rnd.shuffle(cells)
+	board[cells[0][0]][cells[0][1]]=3
+	for (x,y) in cells[1:1+rnd.randint(1,3)]:
+		board[x][y]=1
+	return board
+
+
+def randomMaze(rnd,m,n):
+	'''
+		Returns an m x n maze carved by a random depth first walk over the cells of even coordinates, with a diamond
+		and one to three musketeers on its corridors
+	'''
+	board=[[0]*n for x in range(m)]
+	board[0][0]=2
+	stack=[(0,0)]
+	while stack:
+		(x,y)=stack[-1]
+		steps=[(dx,dy) for (dx,dy) in ((0,2),(2,0),(0,-2),(-2,0))
+			if 0<=x+dx<m and 0<=y+dy<n and board[x+dx][y+dy]==0]
+		if not steps:
+			stack.pop()
+			continue
+		(dx,dy)=rnd.choice(steps)
+		board[x+dx//2][y+dy//2]=2
+		board[x+dx][y+dy]=2
+		stack.append((x+dx,y+dy))
+	cells=[(x,y) for x in range(m) for y in range(n) if board[x][y]==2]
+	rnd.shuffle(cells)
+	board[cells[0][0]][cells[0][1]]=3
+	for (x,y) in cells[1:1+rnd.randint(1,3)]:
+		board[x][y]=1
+	return board
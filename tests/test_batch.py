@@ -0,0 +1,43 @@
+'''
+	test_batch.py checks the batch search of many boards at once against breadth first search
+'''
+
+import random
+import unittest
+
+from boards import randomBoard,randomMaze
+from treasurehunt import engine
+from treasurehunt.batch import solveBatch,numpy
+
+
+@unittest.skipIf(numpy==None,'the batch search needs numpy')
+class BatchTest(unittest.TestCase):
+	def testAgainstSearch(self):
+		# boards of many shapes, several of the same shape, stacked in one batch
+		rnd=random.Random(6)
+		mats=[randomBoard(rnd) for i in range(60)]
+		mats+=[randomMaze(rnd,9,11) for i in range(20)]
+		mats+=[[[1,0,3]],[[2,2,3]],[[1,2,2]]]
+		(lengths,paths)=solveBatch(mats)
+		self.assertEqual(len(lengths),len(mats))
+		for i in range(len(mats)):
+			(expected,stats)=engine.findShortestPath(mats[i],'bfs')
+			self.assertEqual(lengths[i],len(expected)-1 if expected!=[] else -1,mats[i])
+			self.assertEqual(len(paths[i]),len(expected),mats[i])
+			if paths[i]!=[]:
+				(x,y)=paths[i][0]
+				self.assertEqual(mats[i][x][y],1)
+				(x,y)=paths[i][-1]
+				self.assertEqual(mats[i][x][y],3)
+				for k in range(1,len(paths[i])):
+					(x,y)=paths[i][k]
+					(px,py)=paths[i][k-1]
+					self.assertEqual(abs(x-px)+abs(y-py),1)
+					self.assertTrue(mats[i][x][y] in (2,3))
+
+	def testEmpty(self):
+		self.assertEqual(solveBatch([]),([],[]))
+
+
+if __name__=='__main__':
+	unittest.main()
@@ -0,0 +1,37 @@
+'''
+	test_corridor.py checks the search over contracted corridors against breadth first search
+'''
+
+import random
+import unittest
+
+from boards import randomMaze
+from treasurehunt import engine
+
+
+class CorridorTest(unittest.TestCase):
+	def assertSameLength(self,board,prune=False):
+		(expected,stats)=engine.findShortestPath(board,'bfs',prune=prune)
+		(path,stats)=engine.findShortestPath(board,'corridor',prune=prune)
+		self.assertEqual(len(path),len(expected),board)
+
+	def testLoopBackToOneNode(self):
+		# the corridor around the wall leaves the cell left of the musketeer and comes back to it: it has no edge, and
+		# the musketeer next to it moves along it further than any edge
+		board=[[2,2,2,2,2,2,2],
+			[2,0,0,0,0,1,2],
+			[2,2,2,2,2,2,2],
+			[2,0,0,0,0,0,0],
+			[3,0,0,0,0,0,0]]
+		self.assertSameLength(board)
+
+	def testRandomMazes(self):
+		rnd=random.Random(11)
+		for i in range(300):
+			board=randomMaze(rnd,rnd.randint(3,25),rnd.randint(3,25))
+			self.assertSameLength(board)
+			self.assertSameLength(board,prune=True)
+
+
+if __name__=='__main__':
+	unittest.main()
@@ -0,0 +1,56 @@
+'''
+	test_field.py checks the distance field strategy against breadth first search
+'''
+
+import random
+import unittest
+
+from boards import randomBoard
+from treasurehunt import engine,field
+from treasurehunt.board import Board
+
+
+class FieldTest(unittest.TestCase):
+	def testRandomBoards(self):
+		rnd=random.Random(5)
+		for i in range(200):
+			board=randomBoard(rnd)
+			(expected,stats)=engine.findShortestPath(board,'bfs')
+			(path,stats)=engine.findShortestPath(board,'field')
+			self.assertEqual(len(path),len(expected),board)
+			(path,stats)=engine.findShortestPath(board,'field',multisource=True)
+			self.assertEqual(len(path),len(expected),board)
+
+	def testMusketeerInTheWay(self):
+		# the musketeer at [0,0] only gets out through the one at [0,2], which the field of the board without
+		# musketeers does not see: the closer musketeer wins, and its descent never meets the other one
+		board=[[1,2,1,2,3],
+			[2,0,2,0,0],
+			[2,2,2,0,0]]
+		for multisource in (False,True):
+			(expected,stats)=engine.findShortestPath(board,'bfs',multisource)
+			(path,stats)=engine.findShortestPath(board,'field',multisource)
+			self.assertEqual(path,expected)
+
+	def testPlacements(self):
+		# a field is built once per board, wherever the musketeers stand
+		board=[[2]*9 for x in range(9)]
+		board[8][8]=3
+		field.distanceField(Board(board))
+		for x in range(8):
+			board[x][x]=1
+			(path,stats)=engine.findShortestPath(board,'field')
+			board[x][x]=2
+			self.assertEqual(stats['expanded'],0)
+			self.assertEqual(len(path),2*(8-x)+1)
+
+	def testRecord(self):
+		board=[[1,2,2],[0,0,2],[3,2,2]]
+		(exploredNodes,searchQueue,shortestPath)=engine.singleAgentSearch(board,'field')
+		self.assertEqual(len(shortestPath),7)
+		self.assertEqual(exploredNodes,shortestPath)
+		self.assertEqual(len(searchQueue),len(shortestPath))
+
+
+if __name__=='__main__':
+	unittest.main()
@@ -0,0 +1,30 @@
+'''
+	test_multisource.py checks that a search from all musketeers at once only reports the part of the search which
+	belongs to the winning musketeer
+'''
+
+import unittest
+
+import boards		# puts the root of the repository on sys.path
+from treasurehunt import engine
+
+
+class MultiSourceTest(unittest.TestCase):
+	def testDeepeningKeepsTheWinnersCells(self):
+		# the musketeer at [0,2] reaches [2,2] and more before the one at [2,3] wins; IDA* expands some cells for
+		# both of them
+		board=[[2,2,1,0,2,2,2,2,2],
+			[0,0,2,0,0,0,2,0,3],
+			[2,0,2,1,2,0,2,0,2],
+			[2,0,0,0,2,0,2,0,2],
+			[2,2,2,2,2,2,2,2,2]]
+		for strategy in ('idastar','idastar-path'):
+			(exploredNodes,searchQueue,shortestPath)=engine.singleAgentSearch(board,strategy,multisource=True)
+			self.assertEqual(shortestPath[0],[2,3])
+			self.assertEqual(exploredNodes[0],[2,3])
+			self.assertEqual(len(searchQueue),len(exploredNodes))
+			self.assertFalse([0,2] in sum(searchQueue,[]))
+
+
+if __name__=='__main__':
+	unittest.main()
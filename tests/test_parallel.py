@@ -0,0 +1,38 @@
+'''
+	test_parallel.py checks that the searches spread over worker processes give the same answer as run one by one
+'''
+
+import random
+import unittest
+
+from boards import randomBoard
+from treasurehunt import engine
+
+
+class ParallelTest(unittest.TestCase):
+	def testSameAsSerial(self):
+		rnd=random.Random(7)
+		boards=[randomBoard(rnd,0.8) for i in range(6)]
+		boards.append([[1,2,2,2,1],[2,0,2,0,2],[2,2,3,2,2],[2,0,2,0,2],[1,2,2,2,1]])		# four musketeers tied
+		for board in boards:
+			for (strategy,prune) in (('bfs',False),('astar',True),('dfs',False)):
+				expected=engine.singleAgentSearch(board,strategy,prune=prune)
+				self.assertEqual(engine.singleAgentSearch(board,strategy,prune=prune,processes=2),expected)
+				# the searches counted may differ: one by one, the musketeers which can not reach the diamond are
+				# skipped once a search has come back empty
+				(path,stats)=engine.findShortestPath(board,strategy,prune=prune)
+				(parallelPath,parallelStats)=engine.findShortestPath(board,strategy,prune=prune,processes=3)
+				self.assertEqual(parallelPath,path)
+				self.assertEqual(parallelStats['pruned'],stats['pruned'])
+
+	def testProcesses(self):
+		board=[[1,2,3],[2,0,2],[1,2,2]]
+		(path,stats)=engine.findShortestPath(board)
+		self.assertEqual(engine.findShortestPath(board,processes=1),(path,stats))
+		for processes in (0,-2):
+			self.assertRaises(ValueError,engine.findShortestPath,board,processes=processes)
+			self.assertRaises(ValueError,engine.singleAgentSearch,board,processes=processes)
+
+
+if __name__=='__main__':
+	unittest.main()
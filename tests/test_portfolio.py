@@ -0,0 +1,45 @@
+'''
+	test_portfolio.py checks that the race of strategies answers with an optimal strategy's search
+'''
+
+import logging
+import random
+import unittest
+
+from boards import randomBoard
+from treasurehunt import engine
+from treasurehunt.portfolio import PORTFOLIO,portfolioSearch,log
+
+
+class PortfolioTest(unittest.TestCase):
+	def setUp(self):
+		# keeps the warnings about the failing strategies below out of the test output
+		self.handler=logging.NullHandler()
+		log.addHandler(self.handler)
+
+	def tearDown(self):
+		log.removeHandler(self.handler)
+
+	def testWinnerIsOptimal(self):
+		rnd=random.Random(8)
+		optimal=dict(PORTFOLIO)
+		for i in range(4):
+			board=randomBoard(rnd,0.85)
+			(exploredNodes,searchQueue,shortestPath,winner)=portfolioSearch(board)
+			self.assertTrue(optimal[winner])
+			self.assertEqual((exploredNodes,searchQueue,shortestPath),engine.singleAgentSearch(board,winner))
+			(expected,stats)=engine.findShortestPath(board,'bfs')
+			self.assertEqual(len(shortestPath),len(expected))
+
+	def testOnlyOptimalWins(self):
+		board=[[1,2,2,2,2],[2,0,0,0,2],[2,2,2,2,3]]
+		result=portfolioSearch(board,portfolio=[('dfs',False),('bestfirst',False),('astar',True)])
+		self.assertEqual(result[3],'astar')
+
+	def testNoOptimalStrategy(self):
+		board=[[1,2,3]]
+		self.assertRaises(RuntimeError,portfolioSearch,board,portfolio=[('nosuch',True),('dfs',False)])
+
+
+if __name__=='__main__':
+	unittest.main()
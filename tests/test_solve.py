@@ -0,0 +1,41 @@
+'''
+	test_solve.py checks that the batch solver reports a bad board file as an error line and goes on
+'''
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import boards		# puts the root of the repository on sys.path
+from treasurehunt.solve import solveFile
+
+
+class SolveFileTest(unittest.TestCase):
+	def setUp(self):
+		self.dir=tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.dir)
+
+	def solve(self,text):
+		path=os.path.join(self.dir,'board.txt')
+		f=open(path,'w')
+		f.write(text)
+		f.close()
+		return solveFile((path,'bfs','manhattan',False,False))
+
+	def testRaggedRows(self):
+		result=self.solve('1 2 3\n2 2\n2 3 2\n')
+		self.assertTrue('error' in result)
+		self.assertFalse('path' in result)
+
+	def testBoard(self):
+		result=self.solve('1 2 2\n0 0 2\n3 2 2\n')
+		self.assertEqual(result['length'],6)
+		self.assertEqual(result['path'][0],[0,0])
+		self.assertEqual(result['path'][-1],[2,0])
+
+
+if __name__=='__main__':
+	unittest.main()
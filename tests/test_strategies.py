@@ -0,0 +1,77 @@
+'''
+	test_strategies.py checks every search strategy against breadth first search: the optimal ones must find a path
+	as short as it does, and the others a valid path whenever it finds one
+'''
+
+import random
+import unittest
+
+from boards import randomBoard,randomMaze
+from treasurehunt import engine,landmarks
+from treasurehunt.board import Board
+from treasurehunt.wavefront import numpy
+
+OPTIMAL=['bfs-bi','astar','astar-bi','jps','corridor','bitboard','idastar','field']
+if numpy!=None:
+	OPTIMAL.append('wavefront')
+ANY=['dfs','bestfirst']
+# idastar-path keeps no transposition table and takes exponential time on open boards: it runs on the mazes and on
+# the open boards of up to SMALL cells only
+SMALL=64
+
+
+class StrategiesTest(unittest.TestCase):
+	def assertValidPath(self,board,path,strategy):
+		(x,y)=path[0]
+		self.assertEqual(board[x][y],1,strategy)
+		(x,y)=path[-1]
+		self.assertEqual(board[x][y],3,strategy)
+		for k in range(1,len(path)):
+			(x,y)=path[k]
+			(px,py)=path[k-1]
+			self.assertEqual(abs(x-px)+abs(y-py),1,strategy)
+			self.assertTrue(board[x][y] in (2,3),strategy)
+
+	def assertAgree(self,board,maze=False):
+		(expected,stats)=engine.findShortestPath(board,'bfs')
+		strategies=OPTIMAL
+		if maze or len(board)*len(board[0])<=SMALL:
+			strategies=OPTIMAL+['idastar-path']
+		for strategy in strategies:
+			(path,stats)=engine.findShortestPath(board,strategy)
+			self.assertEqual(len(path),len(expected),(strategy,board))
+			if path!=[]:
+				self.assertValidPath(board,path,strategy)
+		for strategy in ANY:
+			(path,stats)=engine.findShortestPath(board,strategy)
+			self.assertEqual(path==[],expected==[],(strategy,board))
+			if path!=[]:
+				self.assertValidPath(board,path,strategy)
+
+	def testRandomBoards(self):
+		rnd=random.Random(3)
+		for i in range(100):
+			self.assertAgree(randomBoard(rnd))
+
+	def testRandomMazes(self):
+		rnd=random.Random(4)
+		for i in range(60):
+			self.assertAgree(randomMaze(rnd,rnd.randint(3,21),rnd.randint(3,21)),maze=True)
+
+	def testUninformedLeavesTheHeuristic(self):
+		# no landmark table is built for a strategy which never reads the heuristic
+		board=[[2]*13 for x in range(11)]
+		board[0][0]=1
+		board[10][12]=3
+		b=Board(board)
+		key=(b.m,b.n,b.goal,bytes(b.openCells()),landmarks.LANDMARKS)
+		for strategy in sorted(engine.STRATEGIES):
+			if strategy!='wavefront' or numpy!=None:
+				if not engine.informed(engine.STRATEGIES[strategy]):
+					engine.findShortestPath(board,strategy,heuristic='alt')
+		self.assertFalse(key in landmarks._tables)
+		engine.findShortestPath(board,'astar',heuristic='alt')
+		self.assertTrue(key in landmarks._tables)
+
+if __name__=='__main__':
+	unittest.main()
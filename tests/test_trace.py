@@ -0,0 +1,85 @@
+'''
+	test_trace.py checks the compact searchQueue: seeking through its keyframes, its restriction to the winning
+	musketeer of a search from all of them, and that it gives the same frontiers as the list form
+'''
+
+import random
+import unittest
+from collections import deque
+
+from boards import randomBoard
+from treasurehunt import engine
+from treasurehunt.trace import SearchTrace
+from treasurehunt.wavefront import numpy
+
+
+class SearchTraceTest(unittest.TestCase):
+	def testSeek(self):
+		# a FIFO queue pushing a cell twice now and then, with keyframes every 4 steps; trace[i] rebuilds from the
+		# keyframe before step i and must match the queue after it, where a cell pushed again while in it keeps the
+		# place of its first push until it has been popped as many times
+		rnd=random.Random(1)
+		trace=SearchTrace(10,keyframe=4)
+		queue=deque()
+		count={}
+		first={}
+		frontiers=[]
+		for step in range(50):
+			for k in range(rnd.randint(0,3)):
+				cell=rnd.randrange(100)
+				trace.push(cell)
+				queue.append(cell)
+				if cell not in count:
+					first[cell]=(step,k)
+				count[cell]=count.get(cell,0)+1
+			if queue:
+				cell=queue.popleft()
+				trace.pop(cell)
+				count[cell]-=1
+				if count[cell]==0:
+					del count[cell]
+			trace.endStep()
+			frontiers.append([[cell//10,cell%10] for cell in sorted(count,key=first.get)])
+
+		self.assertEqual(len(trace),50)
+		self.assertEqual(list(trace),frontiers)
+		for i in [0,3,4,5,7,8,47,49]+[rnd.randrange(50) for k in range(20)]:
+			self.assertEqual(trace[i],frontiers[i],i)
+		self.assertEqual(trace[-1],frontiers[-1])
+		self.assertRaises(IndexError,lambda: trace[50])
+
+	def testCompactMatchesList(self):
+		rnd=random.Random(2)
+		strategies=[strategy for strategy in sorted(engine.STRATEGIES) if strategy!='wavefront' or numpy!=None]
+		for i in range(30):
+			board=randomBoard(rnd,0.85)
+			for strategy in strategies:
+				if strategy=='idastar-path' and len(board)*len(board[0])>64:
+					continue
+				for multisource in (False,True):
+					expected=engine.singleAgentSearch(board,strategy,False,multisource)
+					(exploredNodes,trace,shortestPath)=engine.singleAgentSearch(board,strategy,True,multisource)
+					self.assertEqual(exploredNodes,expected[0],strategy)
+					self.assertEqual(shortestPath,expected[2],strategy)
+					self.assertEqual(list(trace),expected[1],strategy)
+					for k in range(0,len(trace),37):
+						self.assertEqual(trace[k],expected[1][k],(strategy,k))
+
+	def testRestrictToTheWinner(self):
+		# along one corridor the musketeer on the left is closer: nothing from the right one may be shown, over
+		# several keyframes of steps
+		corridor=[1]+[2]*150+[3]+[2]*200+[1]
+		for strategy in ('bfs','astar','idastar'):
+			(exploredNodes,trace,shortestPath)=engine.singleAgentSearch([corridor],strategy,True,True)
+			self.assertEqual(shortestPath[0],[0,0])
+			self.assertEqual(len(trace),len(exploredNodes))
+			self.assertTrue(len(trace)>2*trace.keyframe,strategy)
+			frontiers=list(trace)
+			for k in range(len(trace)):
+				self.assertEqual(trace[k],frontiers[k])
+				for (x,y) in frontiers[k]+[exploredNodes[k]]:
+					self.assertTrue(y<=151,(strategy,k,y))
+
+
+if __name__=='__main__':
+	unittest.main()
@@ -0,0 +1,13 @@
+'''
+	treasurehunt is the search engine shared by the Astar, BFS, BestFirstSearch, DFS and IDAstar directories.
+	Each controller1.py there is a thin wrapper which runs the engine with its own strategy.
+'''
+
+from .batch import solveBatch
+from .board import Board,readBoard
+from .engine import Strategy,STRATEGIES,singleAgentSearch,findShortestPath
+from .field import DistanceField,distanceField
+from .heuristics import HEURISTICS,getHeuristic
+from .landmarks import LandmarkTable,landmarkTable
+from .portfolio import portfolioSearch
+from .trace import SearchTrace
@@ -0,0 +1,95 @@
+'''
+	batch.py solves many boards in one go. Boards of the same shape are stacked into a (boards,m,n) NumPy array and
+	their breadth first searches advance together, one layer of every board per step, as in wavefront.py. This
+	pays off on large numbers of small boards, where running the engine board by board spends most of its time
+	in the Python overhead of every single search.
+	NumPy is optional; without it the rest of the package works and only solveBatch raises ImportError.
+'''
+
+try:
+	import numpy
+except ImportError:
+	numpy=None
+
+from .board import MUSKETEER,SOLDIER,DIAMOND
+from .wavefront import walkBack
+
+
+def solveBatch(mats):
+	'''
+		This function finds the shortest path to the diamond on every board of the list mats (each a list of lists
+		as returned by view.getStartingBoard), searching from all musketeers of a board at once.
+		It returns (lengths,paths) where lengths[i] is the number of moves of the shortest path on mats[i] (-1 if
+		the diamond can not be reached) and paths[i] is that path as a list of [x,y] from a musketeer to the
+		diamond ([] if there is none).
+	'''
+	if numpy==None:
+		raise ImportError('the batch search needs numpy')
+
+	lengths=[-1]*len(mats)
+	paths=[[] for mat in mats]
+	shapes={}
+	for i in range(len(mats)):
+		shapes.setdefault((len(mats[i]),len(mats[i][0])),[]).append(i)
+	for shape in shapes:
+		group=shapes[shape]
+		(dist,goals)=layers(numpy.array([mats[i] for i in group],dtype=numpy.int8))
+		for b in range(len(group)):
+			path=walkBack(dist[b],int(goals[b]))
+			if path!=[]:
+				lengths[group[b]]=len(path)-1
+				paths[group[b]]=path
+	return (lengths,paths)
+
+
+def layers(boards):
+	'''
+		This function runs the wavefront on every board of the (boards,m,n) array boards, from its musketeers until
+		its diamond is reached or nothing new is. It returns (dist,goals) where dist is a (boards,m,n) array with the
+		number of moves from the nearest musketeer to every cell reached (-1 elsewhere) and goals has the cell of the
+		diamond of every board (-1 if there is none; the last one in row order if there are several, as in Board).
+		Boards whose search has ended are dropped from the arrays, so the last layers only cost what the boards
+		still searching need.
+	'''
+	(count,m,n)=boards.shape
+	dist=numpy.full((count,m,n),-1,dtype=numpy.int32)
+	inner=(slice(None),slice(1,-1),slice(1,-1))
+	# free and frontier are bordered by blocked cells, so that a shift never wraps around
+	free=numpy.zeros((count,m+2,n+2),dtype=bool)
+	free[inner]=(boards==SOLDIER)|(boards==DIAMOND)
+	frontier=numpy.zeros((count,m+2,n+2),dtype=bool)
+	frontier[inner]=boards==MUSKETEER
+	diamonds=(boards==DIAMOND).reshape(count,m*n)
+	goals=m*n-1-numpy.argmax(diamonds[:,::-1],axis=1)
+	goals[~diamonds.any(axis=1)]=-1
+	goal=numpy.zeros((count,m*n),dtype=bool)
+	goal[numpy.flatnonzero(goals!=-1),goals[goals!=-1]]=True
+	goal=goal.reshape(count,m,n)
+	dist[boards==MUSKETEER]=0
+	live=numpy.arange(count)		# the board in boards of every board still in the arrays
+	# the neighbour every cell looks at for the moves left, down, right and up into it
+	shifts=((slice(None),slice(1,-1),slice(2,None)),(slice(None),slice(None,-2),slice(1,-1)),
+		(slice(None),slice(1,-1),slice(None,-2)),(slice(None),slice(2,None),slice(1,-1)))
+
+	d=0
+	while len(live):
+		nxt=frontier[shifts[0]]|frontier[shifts[1]]
+		nxt|=frontier[shifts[2]]
+		nxt|=frontier[shifts[3]]
+		nxt&=free[inner]
+		free[inner]&=~nxt
+		d+=1
+		(b,x,y)=numpy.nonzero(nxt)
+		dist[live[b],x,y]=d
+
+		# a board is done when its diamond is reached or its layer is empty
+		going=nxt.any(axis=(1,2))&~(nxt&goal).any(axis=(1,2))
+		if going.all():
+			frontier[inner]=nxt
+		else:
+			live=live[going]
+			free=free[going]
+			goal=goal[going]
+			frontier=numpy.zeros((len(live),m+2,n+2),dtype=bool)
+			frontier[inner]=nxt[going]
+	return (dist,goals)
@@ -0,0 +1,178 @@
+'''
+	bitboard.py keeps a board as three Python integers used as bit sets, one per class of cell: the cells a musketeer
+	can step on, the musketeers and the diamond. Cell (x,y) is bit x*width+y, with width=n+1: the extra column of
+	every row is never set, so a set shifted one column left or right can not wrap around into the next row.
+	A whole layer of a breadth first search then takes a handful of integer operations:
+		next = (f>>1 | f<<width | f<<1 | f>>width) & free
+	where f is the current layer and free the traversable cells not reached yet.
+'''
+
+BITS=bytes(bytearray([48,49])+bytearray(254))		# translates the 0/1 bytes of Board.passable to '0'/'1'
+
+CHECKPOINT=64		# number of layers between the states kept by the search to rebuild its path
+
+
+class Bitboard:
+	'''
+		This class encodes board as bit sets
+		where   width is the number of bits per row, n+1
+				traversable is the set of cells a musketeer can step on (soldiers and the diamond)
+				musketeers is the set of musketeer cells
+				goal is the set holding the diamond cell only (0 if there is none)
+	'''
+	def __init__(self,board):
+		m=board.m
+		n=board.n
+		self.n=n
+		self.width=n+1
+		chars=bytearray(b'0')*(m*self.width)
+		for x in range(m):
+			chars[x*self.width:x*self.width+n]=board.passable[x*n:(x+1)*n].translate(BITS)
+		chars.reverse()
+		self.traversable=int(bytes(chars).decode('ascii') or '0',2)
+		self.musketeers=0
+		for cell in board.musketeers:
+			self.musketeers|=1<<self.bit(cell)
+		self.goal=1<<self.bit(board.goal) if board.goal!=None else 0
+
+	def bit(self,cell):
+		return cell+cell//self.n
+
+	def cell(self,bit):
+		return bit-bit//self.width
+
+	def spread(self,f):
+		'''
+			Returns the set of cells one move away from the cells of f, traversable or not
+		'''
+		width=self.width
+		return f>>1|f<<width|f<<1|f>>width
+
+	def cells(self,f):
+		'''
+			Returns the list of cells in the set f, in increasing order
+		'''
+		t=[]
+		bits=bin(f)[:1:-1]		# bit i is character i
+		i=bits.find('1')
+		while i!=-1:
+			t.append(self.cell(i))
+			i=bits.find('1',i+1)
+		return t
+
+
+def count(f):
+	'''
+		Returns the number of cells in the set f
+	'''
+	return bin(f).count('1')
+
+
+def bitboard(board):
+	'''
+		Returns the Bitboard of board, encoded once per Board
+	'''
+	if board.bits==None:
+		board.bits=Bitboard(board)
+	return board.bits
+
+
+def bitSearch(board,sources,strategy,trace=None,explored=None,origin=None,hfn=None):
+	'''
+		This function runs a breadth first search over the bit sets of board from the musketeer cells in sources, a
+		whole layer at a time, with the arguments and result of engine.search (hfn is not used). Like the search of
+		wavefront.py, recording walks the layers in order: the frontier at every step is the rest of the current layer
+		followed by the whole next one. Only one (visited,layer) pair in every CHECKPOINT layers is kept; the layers
+		the path is rebuilt from are computed again from them.
+	'''
+	bb=bitboard(board)
+	goal=bb.goal
+	fronts=[]		# the part of the layer reached from every source, for origin
+	regions=[]		# the cells reached from every source, for origin
+	layer=0
+	for k in range(len(sources)):
+		f=1<<bb.bit(sources[k])
+		fronts.append(f)
+		regions.append(f)
+		layer|=f
+	visited=layer
+	free=bb.traversable&~visited
+
+	saved=[(visited,layer)]		# the state at every layer which is a multiple of CHECKPOINT
+	depth=0
+	record=trace!=None or explored!=None
+	if trace!=None:
+		for cell in bb.cells(layer):
+			trace.push(cell)
+	while not layer&goal:
+		if origin!=None:
+			# every source keeps its own part of the layer, the earlier sources taking the cells reached by several
+			nxt=0
+			for k in range(len(fronts)):
+				fronts[k]=bb.spread(fronts[k])&free&~nxt
+				nxt|=fronts[k]
+				regions[k]|=fronts[k]
+		else:
+			nxt=bb.spread(layer)&free
+		if record:
+			popLayer(bb,layer,nxt,trace,explored)
+		if not nxt:
+			break
+		free&=~nxt
+		visited|=nxt
+		layer=nxt
+		depth+=1
+		if depth%CHECKPOINT==0:
+			saved.append((visited,layer))
+
+	if origin!=None:
+		for k in range(len(regions)):
+			for cell in bb.cells(regions[k]):
+				origin[cell]=k
+	# every cell reached was expanded, except the cells after the diamond in its layer
+	generated=count(visited)
+	if not layer&goal:
+		return ([],generated,generated)
+	expanded=generated-count(layer&~((goal<<1)-1))
+	if record:
+		popLayer(bb,layer&((goal<<1)-1),0,trace,explored)
+
+	# walk back from the diamond, every step to the first neighbour (left, down, right, up) one layer closer,
+	# rebuilding the layers of every stretch from the state saved at its start
+	width=bb.width
+	b=goal.bit_length()-1
+	path=[bb.cell(b)]
+	for s in range(len(saved)-1,-1,-1):
+		low=s*CHECKPOINT
+		high=min(low+CHECKPOINT,depth)-1
+		(visited,layer)=saved[s]
+		stretch=[layer]
+		for d in range(low,high):
+			layer=bb.spread(layer)&bb.traversable&~visited
+			visited|=layer
+			stretch.append(layer)
+		for d in range(high,low-1,-1):
+			for nb in (b-1,b+width,b+1,b-width):
+				if nb>=0 and stretch[d-low]>>nb&1:
+					b=nb
+					break
+			path.append(bb.cell(b))
+	path.reverse()
+	n=board.n
+	return ([[cell//n,cell%n] for cell in path],expanded,generated)
+
+
+def popLayer(bb,layer,nxt,trace,explored):
+	'''
+		Records the cells of layer as popped one after another, the cells of nxt being pushed with the first of them
+	'''
+	cells=bb.cells(layer)
+	if explored!=None:
+		explored.extend(cells)
+	if trace!=None:
+		for i in range(len(cells)):
+			trace.pop(cells[i])
+			if i==0:
+				for child in bb.cells(nxt):
+					trace.push(child)
+			trace.endStep()
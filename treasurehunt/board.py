@@ -0,0 +1,248 @@
+'''
+	board.py prepares a board (list of lists, as returned by view.getStartingBoard) for the search engine.
+	In board, following convention is followed
+	        1 -> musketeer
+	        2 -> soldier
+	        0 -> empty location
+	        3 -> Soldier With Diamond (Goal State)
+
+	A position (x,y) on the board is represented by its cell index x*n+y, where n is the width of the board.
+'''
+
+from array import array
+
+from .cache import LRUCache
+
+EMPTY=0
+MUSKETEER=1
+SOLDIER=2
+DIAMOND=3
+
+PASSABLE=bytes(bytearray([1 if value==SOLDIER or value==DIAMOND else 0 for value in range(256)]))		# value -> passable
+
+
+class Board:
+	'''
+		This class scans a board once and keeps what every search needs from it
+		where   m,n are the height and width of the board
+				passable is a bytearray with 1 for every cell a musketeer can step on (soldier or diamond)
+				grid is passable with a border of impassable cells all around, (m+2) rows of stride=n+2 cells, so
+					that the neighbours of a cell are found by index arithmetic alone: (x,y) is at (x+1)*stride+y+1
+				goal is the cell of the diamond (None if there is none)
+				musketeers is the list of cells of the musketeers, in row order
+				component is an array with the connected region of every passable or musketeer cell (-1 for the
+					others), set by labels() the first time it is needed or by knownLabels() if it is cached
+				graph is the compiled Graph of the board (see graph.compiled), None until a search needs it
+				bits is the Bitboard of the board (see bitboard.bitboard), None until a search needs it
+				pruned is the number of dead end cells removed from passable by prune(), which runs at once if
+					prune is True
+	'''
+	def __init__(self,mat,prune=False):
+		self.mat=mat
+		self.m=len(mat)
+		self.n=len(mat[0])
+		self.passable=bytearray(self.m*self.n)
+		self.goal=None
+		self.musketeers=[]
+		self.component=None
+		self.graph=None
+		self.bits=None
+		self.pruned=0
+		self.stride=self.n+2
+		self.grid=bytearray((self.m+2)*self.stride)
+
+		n=self.n
+		diamond=bytes(bytearray([DIAMOND]))
+		musketeer=bytes(bytearray([MUSKETEER]))
+		for x in range(0,self.m):
+			row=bytearray(mat[x][:n])
+			if len(row)<n:
+				raise IndexError('row %d of the board has %d cells, row 0 has %d' % (x,len(row),n))
+			# a whole row at a time: the per cell loop would cost more than a search which touches a few cells
+			cells=row.translate(PASSABLE)
+			self.passable[x*n:(x+1)*n]=cells
+			self.grid[(x+1)*self.stride+1:(x+1)*self.stride+1+n]=cells
+			y=row.rfind(diamond)
+			if y!=-1:
+				self.goal=x*n+y
+			y=row.find(musketeer)
+			while y!=-1:
+				self.musketeers.append(x*n+y)
+				y=row.find(musketeer,y+1)
+
+		if prune:
+			self.prune()
+
+	def cell(self,x,y):
+		return x*self.n+y
+
+	def heuristic(self,cell):
+		'''
+			Returns the manhattan distance from cell to the diamond
+		'''
+		n=self.n
+		return abs(self.goal//n-cell//n)+abs(self.goal%n-cell%n)
+
+	def neighbours(self,cell):
+		'''
+			Returns the cells a musketeer at cell can move to, in the order left, down, right, up
+		'''
+		n=self.n
+		stride=n+2
+		grid=self.grid
+		p=cell+(cell//n)*2+stride+1		# index of cell in grid
+		t=[]
+		if grid[p-1]:
+			t.append(cell-1)
+		if grid[p+stride]:
+			t.append(cell+n)
+		if grid[p+1]:
+			t.append(cell+1)
+		if grid[p-stride]:
+			t.append(cell-n)
+		return t
+
+	def prune(self):
+		'''
+			Removes the dead ends from passable: a cell with at most one passable neighbour can only be on a path to
+			the diamond as its first step, so unless it is the diamond or next to a musketeer, it is dropped, and so
+			is every cell which becomes a dead end in turn. Returns the number of cells removed.
+		'''
+		size=self.m*self.n
+		passable=self.passable
+		keep=bytearray(size)
+		if self.goal!=None:
+			keep[self.goal]=1
+		for start in self.musketeers:
+			for cell in self.neighbours(start):
+				keep[cell]=1
+
+		degree=bytearray(size)
+		for cell in range(size):
+			if passable[cell]:
+				degree[cell]=len(self.neighbours(cell))
+		stack=[cell for cell in range(size) if passable[cell] and degree[cell]<=1 and not keep[cell]]
+
+		pruned=0
+		while stack:
+			cell=stack.pop()
+			if not passable[cell]:
+				continue
+			children=self.neighbours(cell)
+			passable[cell]=0
+			self.grid[cell+(cell//self.n)*2+self.stride+1]=0
+			pruned+=1
+			for child in children:
+				degree[child]-=1
+				if degree[child]<=1 and not keep[child]:
+					stack.append(child)
+
+		self.pruned+=pruned
+		self.component=None
+		self.graph=None
+		self.bits=None
+		return pruned
+
+	def openCells(self):
+		'''
+			Returns a bytearray with 1 for every cell which is passable or has a musketeer: the passable cells of
+			the board without its musketeers, the same for every placement of them on soldier cells
+		'''
+		cells=bytearray(self.passable)
+		for start in self.musketeers:
+			cells[start]=1
+		return cells
+
+	def withoutMusketeers(self):
+		'''
+			Returns a Board of the same size and diamond whose passable cells are openCells()
+		'''
+		cells=self.openCells()
+		n=self.n
+		mat=[[SOLDIER if cells[x*n+y] else EMPTY for y in range(n)] for x in range(self.m)]
+		if self.goal!=None:
+			mat[self.goal//n][self.goal%n]=DIAMOND
+		return Board(mat)
+
+	def labels(self):
+		'''
+			Returns the component array of the board with its musketeer cells counted as passable: two cells have
+			the same label if a musketeer could walk from one to the other were the other musketeers not in the way.
+			Musketeers stand on soldier cells, so this is the same for every placement of them on one board, and the
+			labels are shared by every Board with the same size and cells (see regions).
+		'''
+		if self.component==None:
+			cells=self.openCells()
+			self.component=_regions.get((self.m,self.n,bytes(cells)),lambda: regions(cells,self.m,self.n))
+		return self.component
+
+	def knownLabels(self):
+		'''
+			Returns the component array of labels() if it is already known, for this Board or any earlier one with
+			the same size and cells, or None: unlike labels(), it never labels the board
+		'''
+		if self.component==None:
+			key=(self.m,self.n,bytes(self.openCells()))
+			if key in _regions:
+				self.component=_regions.get(key,None)
+		return self.component
+
+	def reachable(self,cell):
+		'''
+			Returns False if a musketeer at cell can not reach the diamond, as it is not in the region of the diamond
+			in labels(). True does not guarantee a path: the way may go through other musketeers.
+		'''
+		if self.goal==None:
+			return False
+		component=self.labels()
+		return component[cell]==component[self.goal]
+
+
+_regions=LRUCache()		# (m,n,cells) -> component array of regions
+
+
+def regions(cells,m,n):
+	'''
+		Labels the connected regions of the cells set in the bytearray cells of an m x n board with union-find,
+		joining every such cell to the ones on its left and above it. Returns the component array (-1 for the cells
+		not set).
+	'''
+	root=array('i',range(m*n))
+
+	def find(cell):
+		while root[cell]!=cell:
+			root[cell]=root[root[cell]]
+			cell=root[cell]
+		return cell
+
+	for cell in range(m*n):
+		if not cells[cell]:
+			continue
+		if cell%n>0 and cells[cell-1]:
+			root[find(cell)]=find(cell-1)
+		if cell>=n and cells[cell-n]:
+			a=find(cell)
+			b=find(cell-n)
+			if a!=b:
+				root[a]=b
+
+	component=array('i',[-1])*(m*n)
+	for cell in range(m*n):
+		if cells[cell]:
+			component[cell]=find(cell)
+	return component
+
+
+def readBoard(path):
+	'''
+		Returns the board (list of lists) in the file path, in the format of input.txt: one row per line, the cells
+		separated by spaces. Blank lines are skipped. Raises ValueError if a cell is not a number or the rows are not
+		all as long as the first one.
+	'''
+	f=open(path,'r')
+	board=[[int(v) for v in line.split()] for line in f if line.strip()]
+	f.close()
+	for x in range(1,len(board)):
+		if len(board[x])!=len(board[0]):
+			raise ValueError('row %d of %s has %d cells, row 1 has %d' % (x+1,path,len(board[x]),len(board[0])))
+	return board
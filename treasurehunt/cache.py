@@ -0,0 +1,35 @@
+'''
+	cache.py holds the least recently used cache behind the per-board precomputations (distance fields, landmark
+	tables, compiled graphs, corridor contractions), so that the same board searched again reuses them.
+'''
+
+from collections import OrderedDict
+
+CACHE_SIZE=32		# default number of results kept by an LRUCache
+
+
+class LRUCache:
+	'''
+		This class keeps the results built for the last size keys, dropping the least recently used one first
+	'''
+	def __init__(self,size=CACHE_SIZE):
+		self.size=size
+		self.entries=OrderedDict()		# key -> result, least recently used first
+
+	def get(self,key,build):
+		'''
+			Returns the result kept under key, or the result of build() kept under key from now on
+		'''
+		result=self.entries.pop(key,None)
+		if result==None:
+			result=build()
+			if len(self.entries)>=self.size:
+				self.entries.popitem(last=False)
+		self.entries[key]=result
+		return result
+
+	def __contains__(self,key):
+		return key in self.entries
+
+	def __len__(self):
+		return len(self.entries)
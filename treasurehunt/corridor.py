@@ -0,0 +1,234 @@
+'''
+	corridor.py contracts the corridors of a board, the chains of passable cells with exactly two passable
+	neighbours, into single weighted edges between the other cells (the nodes), and searches the contracted graph
+	with Dial's bucketed version of Dijkstra's algorithm. A search then only stops at junctions, dead ends, open
+	areas and the diamond; the cells of the corridors it crosses are put back into the path at the end.
+'''
+
+from array import array
+
+from .cache import LRUCache
+from .field import fieldKey
+from .graph import compiled
+
+
+class Corridors:
+	'''
+		This class contracts the corridors of board
+		where   node is a bytearray with 1 for every passable cell which is not inside a corridor (the diamond always
+					is a node)
+				offsets,targets,weights,chains,entries,steps are the edges of every node in CSR form: the edges from
+					node u are i in range(offsets[u],offsets[u+1]), going to targets[i] in weights[i] moves through
+					the cells of corridor chains[i] (-1 for none), from index entries[i] of it in direction steps[i]
+				start,end,first,last give for every corridor k its two end nodes and the range
+					cells[first[k]:last[k]] of its cells, in order from start[k] to end[k]
+				chain,position give the corridor of every cell inside one (-1 for the others) and its index there
+				maxweight is the largest weight of an edge, or of a corridor crossed from end to end (a corridor from a
+					node back to itself has no edge, but a musketeer next to it still moves along it)
+	'''
+	def __init__(self,board):
+		size=board.m*board.n
+		graph=compiled(board)
+		offsets=graph.offsets
+		targets=graph.targets
+		passable=board.passable
+
+		self.node=bytearray(size)
+		for cell in range(size):
+			if passable[cell] and (offsets[cell+1]-offsets[cell]!=2 or cell==board.goal):
+				self.node[cell]=1
+
+		self.start=array('i')
+		self.end=array('i')
+		self.first=array('i')
+		self.last=array('i')
+		self.cells=array('i')
+		self.chain=array('i',[-1])*size
+		self.position=array('i',[0])*size
+		self.offsets=array('i',[0])
+		self.targets=array('i')
+		self.weights=array('i')
+		self.chains=array('i')
+		self.entries=array('i')
+		self.steps=array('i')
+		self.maxweight=1
+
+		node=self.node
+		for u in range(size):
+			if node[u]:
+				for i in range(offsets[u],offsets[u+1]):
+					self.walk(u,targets[i],node,offsets,targets)
+			self.offsets.append(len(self.targets))
+
+	def walk(self,u,cell,node,offsets,targets):
+		'''
+			Adds the edge from node u whose first move is to cell, following the corridor it enters if any
+		'''
+		if node[cell]:
+			self.addEdge(cell,1,-1,0,0)
+			return
+
+		k=self.chain[cell]
+		if k!=-1:
+			# the corridor was walked from its other end already
+			if self.start[k]==u and self.cells[self.first[k]]==cell:
+				(v,entry,step)=(self.end[k],0,1)
+			else:
+				(v,entry,step)=(self.start[k],self.last[k]-self.first[k]-1,-1)
+			if v!=u:
+				self.addEdge(v,self.last[k]-self.first[k]+1,k,entry,step)
+			return
+
+		k=len(self.start)
+		self.start.append(u)
+		self.first.append(len(self.cells))
+		prev=u
+		while not node[cell]:
+			self.chain[cell]=k
+			self.position[cell]=len(self.cells)-self.first[k]
+			self.cells.append(cell)
+			(a,b)=(targets[offsets[cell]],targets[offsets[cell]+1])
+			(prev,cell)=(cell,b if a==prev else a)
+		self.end.append(cell)
+		self.last.append(len(self.cells))
+		if self.last[k]-self.first[k]+1>self.maxweight:
+			self.maxweight=self.last[k]-self.first[k]+1
+		if cell!=u:
+			self.addEdge(cell,self.last[k]-self.first[k]+1,k,0,1)
+
+	def addEdge(self,v,weight,k,entry,step):
+		self.targets.append(v)
+		self.weights.append(weight)
+		self.chains.append(k)
+		self.entries.append(entry)
+		self.steps.append(step)
+		if weight>self.maxweight:
+			self.maxweight=weight
+
+	def walkCells(self,k,entry,step):
+		'''
+			Returns the cells of corridor k from index entry to its end in direction step (+1 or -1)
+		'''
+		t=[]
+		i=self.first[k]+entry
+		while self.first[k]<=i<self.last[k]:
+			t.append(self.cells[i])
+			i+=step
+		return t
+
+
+_corridors=LRUCache()		# fieldKey(board) -> Corridors
+
+
+def corridors(board):
+	'''
+		Returns the Corridors of board, reusing the contraction of any earlier board with the same size, diamond and
+		passable cells. The last cache.CACHE_SIZE contractions are kept.
+	'''
+	return _corridors.get(fieldKey(board),lambda: Corridors(board))
+
+
+def corridorSearch(board,sources,strategy,trace=None,explored=None,origin=None,hfn=None):
+	'''
+		This function runs Dial's algorithm over the contracted board from the musketeer cells in sources, with the
+		arguments and result of engine.search (hfn is not used). explored and trace hold nodes only; the path returned
+		has every cell. A musketeer next to a corridor starts with an edge to each end of it.
+	'''
+	n=board.n
+	goal=board.goal
+	size=board.m*n
+	c=corridors(board)
+	graph=compiled(board)
+
+	dist=array('i',[-1])*size
+	done=bytearray(size)
+	# how every node was reached: from cell prev, through corridor pchain (-1 for none) from index pentry in
+	# direction pstep
+	prev=array('i',[-1])*size
+	pchain=array('i',[-1])*size
+	pentry=array('i',[0])*size
+	pstep=array('i',[0])*size
+
+	nb=c.maxweight+2		# edges are never longer than nb-1, so nb buckets in a ring are enough
+	buckets=[[] for i in range(nb)]
+	state={'queued':0,'generated':0}
+
+	def relax(u,v,d,k,entry,step):
+		if dist[v]!=-1 and dist[v]<=d:
+			return
+		dist[v]=d
+		prev[v]=u
+		pchain[v]=k
+		pentry[v]=entry
+		pstep[v]=step
+		if origin!=None:
+			origin[v]=origin[u]
+		buckets[d%nb].append(v)
+		state['queued']+=1
+		state['generated']+=1
+		if trace!=None:
+			trace.push(v)
+
+	for k in range(len(sources)):
+		start=sources[k]
+		dist[start]=0
+		if origin!=None:
+			origin[start]=k
+		buckets[0].append(start)
+		state['queued']+=1
+		state['generated']+=1
+		if trace!=None:
+			trace.push(start)
+
+	expanded=0
+	d=0
+	found=False
+	while state['queued']:
+		bucket=buckets[d%nb]
+		if not bucket:
+			d+=1
+			continue
+		u=bucket.pop()
+		state['queued']-=1
+		if trace!=None:
+			trace.pop(u)
+		if done[u] or dist[u]!=d:
+			continue
+		done[u]=1
+		expanded+=1
+		if explored!=None:
+			explored.append(u)
+		if u==goal:
+			found=True
+			break
+
+		if c.node[u]:
+			for i in range(c.offsets[u],c.offsets[u+1]):
+				relax(u,c.targets[i],d+c.weights[i],c.chains[i],c.entries[i],c.steps[i])
+		else:
+			# a musketeer: step to its neighbours, or along the corridor each of them is in
+			for cell in graph.neighbours(u):
+				if c.node[cell]:
+					relax(u,cell,d+1,-1,0,0)
+				elif c.chain[cell]!=-1:
+					k=c.chain[cell]
+					i=c.position[cell]
+					length=c.last[k]-c.first[k]
+					relax(u,c.start[k],d+i+2,k,i,-1)
+					relax(u,c.end[k],d+length-i+1,k,i,1)
+		if trace!=None:
+			trace.endStep()
+	if trace!=None:
+		trace.endStep()
+
+	path=[]
+	if found:
+		v=goal
+		while v!=-1:
+			path.append([v//n,v%n])
+			if pchain[v]!=-1:
+				for cell in reversed(c.walkCells(pchain[v],pentry[v],pstep[v])):
+					path.append([cell//n,cell%n])
+			v=prev[v]
+		path.reverse()
+	return (path,expanded,state['generated'])
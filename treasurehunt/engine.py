@@ -0,0 +1,625 @@
+'''
+	engine.py is the single search engine behind the controller1.py of every algorithm directory. A search is
+	described by a Strategy, which says which frontier list is used and how it is ordered, and runs over a Board.
+'''
+
+from array import array
+
+from .board import Board
+from .frontier import OPEN,CLOSED,Queue,Stack,OpenList
+from .graph import adjacency,searched
+from .heuristics import manhattan,getHeuristic
+from .jump import jumpSearch
+from .parallel import checkProcesses,mapBoard,sharedBoard
+from .corridor import corridorSearch
+from .wavefront import wavefrontSearch
+from .bitboard import bitSearch
+from .field import fieldSearch
+from .trace import SearchTrace
+
+
+class Strategy:
+	'''
+		This class describes how the engine orders its frontier list
+		where   name is the name of the strategy
+				frontier is the frontier list class (Queue, Stack or OpenList)
+				priority is None for an unordered frontier, 'g' for uniform cost, 'h' for greedy best first or 'g+h'
+					for A*
+				reopen tells whether a cell is re-opened when a cheaper path to it is found
+				deep tells whether ties on the priority go to the deeper cell (otherwise to the older one)
+				reverse tells whether children are pushed in reverse order, so that a LIFO frontier still explores
+					them in the order left, down, right, up
+				iterative tells whether the search is an iterative deepening depth first search with a growing
+					threshold on g+h (IDA*), which only keeps the current path and the siblings on it
+				table is the largest number of cells an iterative search keeps in its transposition table, so that
+					a cell reached again within an iteration at no smaller g is not searched twice (0 for none)
+				bidirectional tells whether a second search grows from the diamond towards the musketeers
+				jump tells whether the search runs over jump points only (see jump.py)
+				contract tells whether the search runs over the board with its corridors contracted (see corridor.py)
+				wave tells whether the search advances a whole layer at a time with NumPy arrays (see wavefront.py)
+				bits tells whether the search advances a whole layer at a time over the board as bit sets (see bitboard.py)
+				field tells whether the path is read off the distance field of the board (see field.py)
+	'''
+	def __init__(self,name,frontier,priority=None,reopen=False,deep=False,reverse=False,iterative=False,table=0,
+			bidirectional=False,jump=False,contract=False,wave=False,bits=False,field=False):
+		self.name=name
+		self.frontier=frontier
+		self.priority=priority
+		self.reopen=reopen
+		self.deep=deep
+		self.reverse=reverse
+		self.iterative=iterative
+		self.table=table
+		self.bidirectional=bidirectional
+		self.jump=jump
+		self.contract=contract
+		self.wave=wave
+		self.bits=bits
+		self.field=field
+
+
+STRATEGIES={
+	'bfs':Strategy('bfs',Queue),
+	'dfs':Strategy('dfs',Stack,reverse=True),
+	'bestfirst':Strategy('bestfirst',OpenList,'h'),
+	'astar':Strategy('astar',OpenList,'g+h',reopen=True,deep=True),
+	'bfs-bi':Strategy('bfs-bi',OpenList,'g',bidirectional=True),
+	'astar-bi':Strategy('astar-bi',OpenList,'g+h',reopen=True,deep=True,bidirectional=True),
+	'jps':Strategy('jps',OpenList,'g+h',reopen=True,deep=True,jump=True),
+	'corridor':Strategy('corridor',None,'g',contract=True),
+	'wavefront':Strategy('wavefront',None,wave=True),
+	'bitboard':Strategy('bitboard',None,bits=True),
+	'field':Strategy('field',None,field=True),
+	'idastar':Strategy('idastar',Stack,'g+h',iterative=True,table=1<<16),
+	'idastar-path':Strategy('idastar-path',Stack,'g+h',iterative=True),
+}
+
+BACKWARD=-2		# origin of the cells reached only by the search from the diamond
+
+
+def getStrategy(strategy):
+	'''
+		Returns the Strategy registered under the name strategy, or strategy itself if it already is one
+	'''
+	if isinstance(strategy,Strategy):
+		return strategy
+	try:
+		return STRATEGIES[strategy]
+	except KeyError:
+		raise ValueError('unknown search strategy %r' % (strategy,))
+
+
+def informed(strategy):
+	'''
+		Tells whether strategy reads the heuristic: its priority has h in it, or it runs over jump points or deepens
+		a threshold on g+h. The other strategies leave the heuristic unprepared, which for alt saves building a
+		landmark table nothing reads.
+	'''
+	return (strategy.priority!=None and 'h' in strategy.priority) or strategy.jump or strategy.iterative
+
+
+def pathTo(cell,parent,n):
+	'''
+		This function returns the path from the musketeer to cell as a list of [x,y], walking the parent array
+	'''
+	path=[]
+	while cell!=-1:
+		path.append([cell//n,cell%n])
+		cell=parent[cell]
+
+	path.reverse()
+	return path
+
+
+def search(board,sources,strategy,trace=None,explored=None,origin=None,hfn=None):
+	'''
+		This function runs one search from the musketeer cells in sources until the diamond is taken from the frontier
+		list or the frontier list runs out. All sources seed the same frontier list, so with several of them the first
+		path to reach the diamond is the shortest one from any of them (for bfs and astar).
+		If given, the SearchTrace trace and the array explored record the frontier list and the explored cells, and
+		the array origin gets, for every cell reached, the index in sources of the musketeer it was reached from.
+		hfn is the estimate hfn(cell) of the distance to the diamond, manhattan distance if it is None.
+		Returns (path,expanded,generated) where path is [] if the diamond was not reached.
+	'''
+	n=board.n
+	goal=board.goal
+	gx=goal//n
+	gy=goal%n
+
+	status=bytearray(board.m*n)				# OPEN/CLOSED flag of every cell
+	parent=array('i',[-1])*(board.m*n)		# parent cell of every cell reached
+	gcost=array('i',[0])*(board.m*n)		# cheapest g found so far for every cell, valid where status is not 0
+	graph=adjacency(board)					# None until the board is worth compiling: moves are read from its grid
+	if graph!=None:
+		offsets=graph.offsets
+		targets=graph.targets
+
+	ordered=strategy.priority!=None
+	useg=strategy.priority=='g+h'
+	useh=strategy.priority!='g'
+	reopen=strategy.reopen
+	deep=strategy.deep
+	reverse=strategy.reverse
+
+	fl=strategy.frontier(trace)
+	for k in range(len(sources)):
+		start=sources[k]
+		h=hfn(start) if hfn!=None else abs(gx-start//n)+abs(gy-start%n)
+		fl.push(start,h,0)
+		status[start]=OPEN
+		if origin!=None:
+			origin[start]=k
+	expanded=0
+	en=-1
+	while not fl.empty():
+		en=fl.pop()
+		expanded+=1
+		if explored!=None:
+			explored.append(en)
+		status[en]=CLOSED
+		if en==goal:
+			break
+		g=gcost[en]+1
+		children=targets[offsets[en]:offsets[en+1]] if graph!=None else board.neighbours(en)
+		if reverse:
+			children.reverse()
+		for child in children:
+			if status[child]!=0 and not (reopen and g<gcost[child]):
+				continue
+			f=0
+			if ordered:
+				h=0
+				if useh:
+					h=hfn(child) if hfn!=None else abs(gx-child//n)+abs(gy-child%n)
+				f=g+h if useg or not useh else h
+			fl.push(child,f,-g if deep else None)
+			gcost[child]=g
+			parent[child]=en
+			status[child]=OPEN
+			if origin!=None:
+				origin[child]=origin[en]
+		if trace!=None:
+			trace.endStep()
+	if trace!=None:
+		trace.endStep()
+
+	path=[]
+	if en==goal:
+		path=pathTo(en,parent,n)
+	return (path,expanded,fl.pushed)
+
+
+def bisearch(board,sources,strategy,trace=None,explored=None,origin=None,hfn=None):
+	'''
+		This function runs a bidirectional search: a forward search from the musketeer cells in sources and a
+		backward search from the diamond, each on its own open list, expanding from the smaller one at every step.
+		Every time a cell is reached by both, the cost mu of the best path through it is kept, and the search stops
+		once no path left can be cheaper, i.e. when mu is at most the larger of the two smallest g+h (or at most the
+		sum of the two smallest g with priority 'g').
+		The backward search estimates the manhattan distance to the nearest musketeer, and it steps onto the
+		musketeer cells next to the cells it expands (without expanding them), so that it meets a musketeer which the
+		forward search has not expanded yet. Both waves are recorded in
+		trace and explored; origin is as for search, with BACKWARD for the cells only the backward search reached.
+		Returns (path,expanded,generated) where path is [] if the diamond can not be reached.
+	'''
+	n=board.n
+	goal=board.goal
+	gx=goal//n
+	gy=goal%n
+	size=board.m*n
+	starts=[(start//n,start%n) for start in sources]
+	source=bytearray(size)
+	for start in sources:
+		source[start]=1
+	useh=strategy.priority=='g+h'
+	deep=strategy.deep
+
+	# index 0 is the forward search, index 1 the backward one
+	status=[bytearray(size),bytearray(size)]
+	parent=[array('i',[-1])*size,array('i',[-1])*size]
+	gcost=[array('i',[0])*size,array('i',[0])*size]
+	fl=[OpenList(trace),OpenList(trace)]
+	graph=adjacency(board)
+	if graph!=None:
+		offsets=graph.offsets
+		targets=graph.targets
+
+	def estimate(side,cell):
+		if not useh:
+			return 0
+		if side==0:
+			return hfn(cell) if hfn!=None else abs(gx-cell//n)+abs(gy-cell%n)
+		x=cell//n
+		y=cell%n
+		return min([abs(sx-x)+abs(sy-y) for (sx,sy) in starts])
+
+	for k in range(len(sources)):
+		start=sources[k]
+		fl[0].push(start,estimate(0,start),0)
+		status[0][start]=OPEN
+		if origin!=None:
+			origin[start]=k
+	fl[1].push(goal,estimate(1,goal),0)
+	status[1][goal]=OPEN
+	if origin!=None:
+		origin[goal]=BACKWARD
+
+	mu=-1			# cost of the best path found so far (-1 for none)
+	meet=-1			# cell where that path goes from the forward to the backward search
+	expanded=0
+	while not fl[0].empty() and not fl[1].empty():
+		if mu!=-1:
+			(ff,fb)=(fl[0].top(),fl[1].top())
+			if mu<=(max(ff,fb) if useh else ff+fb):
+				break
+		side=0 if fl[0].size()<=fl[1].size() else 1
+		other=1-side
+		en=fl[side].pop()
+		expanded+=1
+		if explored!=None:
+			explored.append(en)
+		status[side][en]=CLOSED
+		g=gcost[side][en]+1
+		children=targets[offsets[en]:offsets[en+1]] if graph!=None else board.neighbours(en)
+		if side==1:
+			if source[en]:
+				children=[]
+			else:
+				x=en//n
+				y=en%n
+				for (cx,cy) in ((x,y-1),(x+1,y),(x,y+1),(x-1,y)):
+					if 0<=cx<board.m and 0<=cy<n and source[cx*n+cy]:
+						children.append(cx*n+cy)
+		for child in children:
+			if status[side][child]!=0 and not g<gcost[side][child]:
+				continue
+			fl[side].push(child,g+estimate(side,child),-g if deep else None)
+			gcost[side][child]=g
+			parent[side][child]=en
+			status[side][child]=OPEN
+			if origin!=None:
+				if side==0:
+					origin[child]=origin[en]
+				elif origin[child]==-1:
+					origin[child]=BACKWARD
+			if status[other][child]!=0 and (mu==-1 or g+gcost[other][child]<mu):
+				mu=g+gcost[other][child]
+				meet=child
+		if trace!=None:
+			trace.endStep()
+
+	path=[]
+	if meet!=-1:
+		path=pathTo(meet,parent[0],n)
+		cell=parent[1][meet]
+		while cell!=-1:
+			path.append([cell//n,cell%n])
+			cell=parent[1][cell]
+	return (path,expanded,fl[0].pushed+fl[1].pushed)
+
+
+def deepen(board,sources,strategy,trace=None,explored=None,threshold=0,origin=None,hfn=None,expandedFor=None):
+	'''
+		This function runs one iteration of IDA*: a depth first search from the musketeer cells in sources which
+		leaves out every cell whose g+h exceeds threshold. The stack holds the children still to be searched of the
+		cells on the current path, best g+h on top, so memory grows with the depth of the search and not with the
+		number of cells reached. A cell already on the current path is not pushed again.
+		trace, explored, origin and hfn are as for search; origin is cleared first, as every iteration starts over.
+		A cell may be expanded more than once, for different musketeers, so if given, the array expandedFor gets the
+		index in sources of the musketeer every cell appended to explored was expanded for.
+		Returns (path,expanded,generated,nxtthreshold) where nxtthreshold is the smallest g+h which exceeded
+		threshold (None if nothing was left out).
+	'''
+	n=board.n
+	goal=board.goal
+	gx=goal//n
+	gy=goal%n
+
+	graph=adjacency(board)
+	if graph!=None:
+		offsets=graph.offsets
+		targets=graph.targets
+	table={} if strategy.table else None		# cell -> smallest g it was pushed with in this iteration
+	stack=[]			# (cell,g,k) of the cells still to be searched, k the index in sources they descend from
+	path=[]				# path[g] is the cell at depth g of the current path
+	onpath=set()
+	expanded=0
+	generated=0
+	nxtthreshold=None
+	if origin!=None:
+		origin[:]=array('i',[-1])*len(origin)
+
+	for k in range(len(sources)-1,-1,-1):
+		start=sources[k]
+		h=hfn(start) if hfn!=None else abs(gx-start//n)+abs(gy-start%n)
+		if h>threshold:
+			if nxtthreshold==None or h<nxtthreshold:
+				nxtthreshold=h
+			continue
+		stack.append((start,0,k))
+		generated+=1
+		if trace!=None:
+			trace.push(start)
+		if origin!=None:
+			origin[start]=k
+
+	found=False
+	while stack:
+		(en,g,k)=stack.pop()
+		expanded+=1
+		if trace!=None:
+			trace.pop(en)
+		if explored!=None:
+			explored.append(en)
+		if expandedFor!=None:
+			expandedFor.append(k)
+		for cell in path[g:]:
+			onpath.discard(cell)
+		del path[g:]
+		path.append(en)
+		onpath.add(en)
+		if en==goal:
+			found=True
+			break
+
+		g+=1
+		moves=targets[offsets[en]:offsets[en+1]] if graph!=None else board.neighbours(en)
+		children=[]
+		for child in moves:
+			if child in onpath:
+				continue
+			f=g+(hfn(child) if hfn!=None else abs(gx-child//n)+abs(gy-child%n))
+			if f>threshold:
+				if nxtthreshold==None or f<nxtthreshold:
+					nxtthreshold=f
+				continue
+			if table!=None:
+				if table.get(child,g+1)<=g:
+					continue
+				if child in table or len(table)<strategy.table:
+					table[child]=g
+			children.append((f,child))
+
+		# stable sort, so among equal g+h the order left, down, right, up is kept
+		children.sort(key=lambda fc: -fc[0])
+		for (f,child) in children:
+			stack.append((child,g,k))
+			generated+=1
+			if trace!=None:
+				trace.push(child)
+			if origin!=None:
+				origin[child]=k
+		if trace!=None:
+			trace.endStep()
+	if trace!=None:
+		trace.endStep()
+
+	if not found:
+		return ([],expanded,generated,nxtthreshold)
+	return ([[cell//n,cell%n] for cell in path],expanded,generated,nxtthreshold)
+
+
+def run(board,sources,strategy,record=True,origin=None,heuristic=None,expandedFor=None):
+	'''
+		This function runs strategy from the musketeer cells in sources; an iterative strategy is repeated with a
+		growing threshold until the diamond is found or nothing is left out by the threshold. With record set, the explored
+		cells and the SearchTrace of the last search are kept. origin is passed on to search, expandedFor to deepen
+		(holding the last iteration), and heuristic is a name or function as accepted by heuristics.getHeuristic
+		(manhattan if it is None); it is only prepared for the board if strategy is informed.
+		Returns (path,explored,trace,stats) where stats counts the nodes expanded and generated over all searches.
+	'''
+	hfn=None
+	if heuristic!=None and informed(strategy) and getHeuristic(heuristic)!=manhattan:
+		hfn=getHeuristic(heuristic)(board)
+	stats={'searches':1,'expanded':0,'generated':0}
+	threshold=None
+	if strategy.iterative:
+		threshold=min([hfn(start) if hfn!=None else board.heuristic(start) for start in sources])
+	while(1):
+		explored=array('i') if record else None
+		trace=SearchTrace(board.n) if record else None
+		if strategy.iterative:
+			if expandedFor!=None:
+				del expandedFor[:]
+			(path,expanded,generated,nxtthreshold)=deepen(board,sources,strategy,trace,explored,threshold,origin,hfn,
+				expandedFor)
+		elif strategy.jump:
+			(path,expanded,generated)=jumpSearch(board,sources,strategy,trace,explored,origin,hfn)
+			nxtthreshold=None
+		elif strategy.contract:
+			(path,expanded,generated)=corridorSearch(board,sources,strategy,trace,explored,origin,hfn)
+			nxtthreshold=None
+		elif strategy.wave:
+			(path,expanded,generated)=wavefrontSearch(board,sources,strategy,trace,explored,origin,hfn)
+			nxtthreshold=None
+		elif strategy.bits:
+			(path,expanded,generated)=bitSearch(board,sources,strategy,trace,explored,origin,hfn)
+			nxtthreshold=None
+		elif strategy.field:
+			(path,expanded,generated)=fieldSearch(board,sources,strategy,trace,explored,origin,hfn)
+			nxtthreshold=None
+		elif strategy.bidirectional:
+			(path,expanded,generated)=bisearch(board,sources,strategy,trace,explored,origin,hfn)
+			nxtthreshold=None
+		else:
+			(path,expanded,generated)=search(board,sources,strategy,trace,explored,origin,hfn)
+			nxtthreshold=None
+		stats['expanded']+=expanded
+		stats['generated']+=generated
+		searched(board,expanded)
+		if path!=[] or threshold==None or nxtthreshold==None:
+			return (path,explored,trace,stats)
+		threshold=nxtthreshold
+
+
+def searchFrom(task):
+	'''
+		Runs in a worker process of parallel.mapBoard: task is (start,strategy,record,heuristic), and strategy is run
+		from the musketeer cell start on the shared Board
+	'''
+	(start,strategy,record,heuristic)=task
+	return run(sharedBoard(),[start],strategy,record,None,heuristic)
+
+
+def eachStart(board,mat,starts,strategy,record,heuristic,prune,processes):
+	'''
+		Runs strategy from every musketeer cell in starts on its own and returns the results of run, in the order of
+		starts. Without processes they are computed one at a time as they are taken; with processes, the searches
+		are spread over that many worker processes sharing the board mat (see parallel.py), and heuristic must be a
+		name or a module level function so that it can be sent to them.
+	'''
+	if processes==None or len(starts)<2:
+		return searchEach(board,starts,strategy,record,heuristic)
+	return mapBoard(searchFrom,mat,prune,[(start,strategy,record,heuristic) for start in starts],processes)
+
+
+def searchEach(board,starts,strategy,record,heuristic):
+	'''
+		Runs strategy from every musketeer cell in starts in turn and yields the results of run. Once a search comes
+		back empty, the board is labelled (see Board.labels) and the later musketeers outside the region of the
+		diamond are skipped, as their searches would come back empty too.
+	'''
+	failed=False
+	for start in starts:
+		if failed and not board.reachable(start):
+			continue
+		result=run(board,[start],strategy,record,None,heuristic)
+		if result[0]==[]:
+			failed=True
+		yield result
+
+
+def replaces(path,best,found):
+	'''
+		Tells whether path, found after found other paths, replaces the shortest path best so far. Ties are broken
+		as the original controllers did: the second path found needs to be shorter than the first, and every later
+		one only needs to be as short as the best.
+	'''
+	if found==1:
+		return len(path)<len(best)
+	return len(path)<=len(best)
+
+
+def singleAgentSearch(mat,strategy='bfs',compact=False,multisource=False,heuristic='manhattan',prune=False,
+		processes=None):
+	'''
+		This function runs strategy from every musketeer on the board mat (list of lists) and returns the
+		(exploredNodes,searchQueue,shortestPath) triple of the musketeer with the shortest path to the diamond, as
+		described for controller1.singleAgentSearch. If compact is True, searchQueue is the SearchTrace itself.
+		With multisource, all musketeers are searched in one pass (see search) and the explored nodes and frontier
+		list are restricted to the cells reached from the winning musketeer.
+		heuristic is the name of a heuristic in heuristics.HEURISTICS or a function of the same form; it is only
+		used by the informed strategies. With prune, dead ends are removed from the board first (see Board.prune).
+		With processes, the musketeers are searched in parallel by up to that many worker processes (see eachStart);
+		the result is the same. processes is None (the default) to search them in the calling process, or at least 1.
+	'''
+	strategy=getStrategy(strategy)
+	getHeuristic(heuristic)		# an unknown heuristic raises ValueError before any search
+	checkProcesses(processes)	# and so does a number of processes below 1
+	board=Board(mat,prune)
+	starts=reachableMusketeers(board)
+	if starts==[]:
+		return ([],[],[])
+
+	if multisource:
+		best=multiSourceSearch(board,starts,strategy,heuristic)
+	else:
+		best=None
+		found=0
+		for (path,explored,trace,stats) in eachStart(board,mat,starts,strategy,True,heuristic,prune,processes):
+			if path!=[]:
+				if best==None or replaces(path,best[0],found):
+					best=(path,explored,trace)
+				found+=1
+
+	if best==None:
+		return ([],[],[])
+
+	(shortestPath,explored,trace)=best
+	n=board.n
+	exploredNodes=[[cell//n,cell%n] for cell in explored]
+	searchQueue=trace if compact else list(trace)
+	return (exploredNodes,searchQueue,shortestPath)
+
+
+def reachableMusketeers(board):
+	'''
+		Returns the cells of the musketeers of board which may reach the diamond. Labelling a board costs a pass over
+		all of its cells, more than a search which only touches a few, so the musketeers are only filtered here when
+		the labels of the board are known already (see Board.knownLabels); otherwise all of them are returned and
+		searchEach labels the board once a search has come back empty.
+	'''
+	if board.goal==None:
+		return []
+	component=board.knownLabels()
+	if component==None:
+		return list(board.musketeers)
+	return [start for start in board.musketeers if component[start]==component[board.goal]]
+
+
+def multiSourceSearch(board,starts,strategy,heuristic=None):
+	'''
+		This function searches from all the musketeer cells in starts in one pass and returns (path,explored,trace)
+		for the musketeer whose path reached the diamond, keeping only the explored cells and frontier events of the
+		cells reached from that musketeer. An iterative strategy may expand a cell for several musketeers, so its
+		explored cells and steps are kept by the musketeer they were expanded for instead.
+		Returns None if no musketeer reaches the diamond.
+	'''
+	origin=array('i',[-1])*(board.m*board.n)
+	expandedFor=array('i') if strategy.iterative else None
+	(path,explored,trace,stats)=run(board,starts,strategy,True,origin,heuristic,expandedFor)
+	if path==[]:
+		return None
+
+	winner=origin[board.cell(path[0][0],path[0][1])]
+	if expandedFor!=None:
+		# every step pops and pushes cells for the musketeer it expanded for, but the first one also pushes all
+		# the musketeers: only the winner's is kept, wherever it falls
+		keep=bytearray([1])*(board.m*board.n)
+		for start in starts:
+			keep[start]=0
+		keep[starts[winner]]=2
+		steps=bytearray([k==winner for k in expandedFor])
+		trace=trace.restrict(keep,explored,steps)
+		explored=array('i',[explored[i] for i in range(len(explored)) if steps[i]])
+		return (path,explored,trace)
+
+	keep=bytearray(board.m*board.n)
+	for cell in range(board.m*board.n):
+		if origin[cell]==winner or origin[cell]==BACKWARD:
+			keep[cell]=1
+	trace=trace.restrict(keep,explored)
+	explored=array('i',[cell for cell in explored if keep[cell]])
+	return (path,explored,trace)
+
+
+def findShortestPath(mat,strategy='bfs',multisource=False,heuristic='manhattan',prune=False,processes=None):
+	'''
+		This function runs the same searches as singleAgentSearch without recording the explored nodes or the
+		frontier list. It returns (shortestPath,stats) where stats counts the searches run, the nodes expanded
+		and generated over all of them and the dead end cells pruned.
+	'''
+	strategy=getStrategy(strategy)
+	getHeuristic(heuristic)		# an unknown heuristic raises ValueError before any search
+	checkProcesses(processes)	# and so does a number of processes below 1
+	board=Board(mat,prune)
+	shortestPath=[]
+	total={'searches':0,'expanded':0,'generated':0,'pruned':board.pruned}
+	starts=reachableMusketeers(board)
+	if starts==[]:
+		return (shortestPath,total)
+
+	if multisource:
+		results=[run(board,starts,strategy,False,None,heuristic)]
+	else:
+		results=eachStart(board,mat,starts,strategy,False,heuristic,prune,processes)
+	found=0
+	for (path,explored,trace,stats) in results:
+		for key in stats:
+			total[key]+=stats[key]
+		if path!=[]:
+			if shortestPath==[] or replaces(path,shortestPath,found):
+				shortestPath=path
+			found+=1
+
+	return (shortestPath,total)
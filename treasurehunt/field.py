@@ -0,0 +1,157 @@
+'''
+	field.py holds DistanceField, the distance from every cell of a board to the diamond.
+	All musketeers share one diamond, so a single breadth first search backwards from it answers the shortest path
+	question for every musketeer, and for any later musketeer placed on the same board, by greedy descent.
+	The field is built on the board without its musketeers (see Board.withoutMusketeers), so that one field serves
+	every placement of them. For a lone musketeer it is exact. With several, a descent which stepped on another
+	musketeer would not be a path; it never does from the musketeer closest to the diamond, as every cell of its
+	descent is closer still, and the search falls back to a field of the board as it is if it ever did.
+'''
+
+from array import array
+
+from .cache import LRUCache
+from .landmarks import distancesFrom
+
+
+class DistanceField:
+	'''
+		This class runs a breadth first search from the diamond of board over the passable cells (see
+		landmarks.distancesFrom)
+		where   dist is an array with the number of moves from every cell to the diamond (-1 if it is not reachable)
+				expanded,generated are the number of cells the search took from and put in its queue
+		No reference to board is kept: the methods take the board whose moves they follow.
+	'''
+	def __init__(self,board):
+		if board.goal==None:
+			self.dist=array('i',[-1])*(board.m*board.n)
+		else:
+			self.dist=distancesFrom(board,board.goal)
+		# the search runs until its queue is empty: every cell reached was put in it and taken from it once
+		self.expanded=len(self.dist)-self.dist.count(-1)
+		self.generated=self.expanded
+
+	def distance(self,board,cell):
+		'''
+			Returns the number of moves from cell to the diamond, or -1 if the diamond can not be reached from cell.
+			A cell the field did not reach, such as a musketeer of the board it was built on, goes through its
+			closest neighbour on board.
+		'''
+		if self.dist[cell]!=-1:
+			return self.dist[cell]
+		best=-1
+		for child in board.neighbours(cell):
+			d=self.dist[child]
+			if d!=-1 and (best==-1 or d+1<best):
+				best=d+1
+		return best
+
+	def pathFrom(self,board,cell):
+		'''
+			Returns a shortest path from cell to the diamond over the moves of board as a list of [x,y], or [] if
+			there is none or the descent is blocked on board (by a musketeer the field did not know of).
+			Every step moves to the first neighbour (left, down, right, up) one move closer to the diamond.
+		'''
+		d=self.distance(board,cell)
+		if d==-1:
+			return []
+
+		n=board.n
+		dist=self.dist
+		path=[[cell//n,cell%n]]
+		while d>0:
+			d-=1
+			for child in board.neighbours(cell):
+				if dist[child]==d:
+					cell=child
+					break
+			else:
+				return []
+			path.append([cell//n,cell%n])
+		return path
+
+
+_fields=LRUCache()		# (m,n,goal,openCells) -> DistanceField of the board without its musketeers
+
+
+def fieldKey(board):
+	'''
+		Returns the key under which a precomputation on board is cached when it depends on the passable cells, so
+		that musketeers only enter it through the cells they make impassable
+	'''
+	return (board.m,board.n,board.goal,bytes(board.passable))
+
+
+def distanceField(board):
+	'''
+		Returns the DistanceField of board without its musketeers, reusing the one computed for any earlier board
+		with the same size, diamond and cells, wherever its musketeers stood. The last cache.CACHE_SIZE fields are
+		kept.
+	'''
+	key=(board.m,board.n,board.goal,bytes(board.openCells()))
+	return _fields.get(key,lambda: DistanceField(board.withoutMusketeers()))
+
+
+def fieldSearch(board,sources,strategy=None,trace=None,explored=None,origin=None,hfn=None):
+	'''
+		This function answers the search of engine.search from the distance field of board, with the same arguments
+		and result (strategy and hfn are not used). The sources closest to the diamond on the field of the board
+		without its musketeers are tried first, in the order of sources: their distance is a lower bound for every
+		source, so a descent from one of them which avoids the other musketeers is a shortest path. If all of these
+		descents are blocked, the field of board as it is, musketeers included, is computed and descended instead.
+		expanded and generated count the breadth first searches which built the fields, and are 0 when the field was
+		cached. Recording shows the walk down the path, one cell a step, and origin gets the index in sources of the
+		winning source along the path.
+	'''
+	key=(board.m,board.n,board.goal,bytes(board.openCells()))
+	built=key not in _fields
+	field=distanceField(board)
+	expanded=field.expanded if built else 0
+	generated=field.generated if built else 0
+
+	(best,path)=descend(field,board,sources)
+	if best==-1 and path==None:
+		field=DistanceField(board)
+		expanded+=field.expanded
+		generated+=field.generated
+		(best,path)=descend(field,board,sources)
+	if best==-1:
+		return ([],expanded,generated)
+
+	n=board.n
+	cells=[x*n+y for (x,y) in path]
+	if origin!=None:
+		for cell in cells:
+			origin[cell]=best
+	if explored!=None:
+		explored.extend(cells)
+	if trace!=None:
+		trace.push(cells[0])
+		for i in range(len(cells)):
+			trace.pop(cells[i])
+			if i+1<len(cells):
+				trace.push(cells[i+1])
+			trace.endStep()
+	return (path,expanded,generated)
+
+
+def descend(field,board,sources):
+	'''
+		Returns (k,path) for the first of the sources closest to the diamond on field whose descent is not blocked
+		on board, where k is its index in sources. Returns (-1,[]) if no source reaches the diamond, and (-1,None)
+		if the closest ones are all blocked.
+	'''
+	bestd=-1
+	for start in sources:
+		d=field.distance(board,start)
+		if d!=-1 and (bestd==-1 or d<bestd):
+			bestd=d
+	if bestd==-1:
+		return (-1,[])
+
+	for k in range(len(sources)):
+		if field.distance(board,sources[k])==bestd:
+			path=field.pathFrom(board,sources[k])
+			if path!=[]:
+				return (k,path)
+	return (-1,None)
@@ -0,0 +1,124 @@
+'''
+	frontier.py holds the frontier lists the search engine can use. They share one surface:
+	push(cell,f,tiebreak), pop(), empty(), size() and the pushed counter, and they report every push and pop to an
+	optional SearchTrace. Queue and Stack ignore the priority f.
+'''
+
+import heapq
+from collections import deque
+
+OPEN=1			# status of a cell which is in the frontier list
+CLOSED=2		# status of a cell which is in the explored nodes set
+
+
+class Queue:
+	'''
+		This is a First in First Out (FIFO) Queue of cells backed by collections.deque, so push and pop are O(1).
+		Cells are kept in insertion order, oldest first.
+	'''
+	def __init__(self,trace=None):
+		self.items=deque()
+		self.trace=trace		# SearchTrace recording pushes and pops, if any
+		self.pushed=0			# number of cells ever pushed
+
+	def push(self,cell,f=0,tiebreak=None):
+		self.items.append(cell)
+		self.pushed+=1
+		if self.trace!=None:
+			self.trace.push(cell)
+		return True
+
+	def pop(self):
+		cell=self.items.popleft()
+		if self.trace!=None:
+			self.trace.pop(cell)
+		return cell
+
+	def empty(self):
+		return not self.items
+
+	def size(self):
+		return len(self.items)
+
+	enqueue=push
+	dequeue=pop
+	isEmpty=empty
+
+
+class Stack(Queue):
+	'''
+		This is a Last in First Out (LIFO) Queue of cells backed by collections.deque.
+		Cells are kept in insertion order, oldest first.
+	'''
+	def pop(self):
+		cell=self.items.pop()
+		if self.trace!=None:
+			self.trace.pop(cell)
+		return cell
+
+	dequeue=pop
+
+
+class OpenList:
+	'''
+		This is a single threaded priority queue of cells used as the frontier list. It is built on heapq with tuple
+		keys (f,tiebreak,cell), where cell is the index x*n+y of the position.
+		Every cell has at most one live entry; pushing a cell again with a smaller key is a decrease-key, and the
+		entry it replaces is left in the heap and skipped when it is popped (lazy deletion).
+	'''
+	def __init__(self,trace=None):
+		self.heap=[]
+		self.entry={}		# cell -> key of the live entry of every cell in the open list
+		self.counter=0		# insertion counter used as the default tiebreak (FIFO among equal f)
+		self.trace=trace	# SearchTrace recording pushes and pops, if any
+		self.pushed=0		# number of successful pushes, decrease-keys included
+
+	def push(self,cell,f=0,tiebreak=None):
+		'''
+			Adds cell with priority f, or lowers its key if it is already present with a larger one.
+			Returns False (and changes nothing) if cell is already present with a key that is not larger.
+		'''
+		if tiebreak==None:
+			tiebreak=self.counter
+			self.counter+=1
+		key=(f,tiebreak,cell)
+		old=self.entry.get(cell)
+		if old!=None and old<=key:
+			return False
+		self.entry[cell]=key
+		heapq.heappush(self.heap,key)
+		self.pushed+=1
+		if old==None and self.trace!=None:
+			self.trace.push(cell)
+		return True
+
+	def pop(self):
+		'''
+			Removes and returns the cell with the smallest key, skipping entries which were replaced
+		'''
+		while self.heap:
+			key=heapq.heappop(self.heap)
+			cell=key[2]
+			if self.entry.get(cell)==key:
+				del self.entry[cell]
+				if self.trace!=None:
+					self.trace.pop(cell)
+				return cell
+		raise IndexError('pop from an empty open list')
+
+	def top(self):
+		'''
+			Returns the priority f of the cell pop() would return next, or None if the open list is empty
+		'''
+		heap=self.heap
+		while heap and self.entry.get(heap[0][2])!=heap[0]:
+			heapq.heappop(heap)
+		if heap:
+			return heap[0][0]
+		return None
+
+	def empty(self):
+		return not self.entry
+
+	def size(self):
+		return len(self.entry)
@@ -0,0 +1,69 @@
+'''
+	graph.py compiles the moves of a board into a compressed sparse row (CSR) adjacency structure, so that the inner
+	loop of a search reads the neighbours of a cell as a slice of an array instead of checking the board again.
+'''
+
+from array import array
+
+from .cache import LRUCache
+
+
+class Graph:
+	'''
+		This class holds the moves of a board in CSR form
+		where   offsets is an array of m*n+1 entries
+				targets is an array with the cells a musketeer can move to from every cell, in the order left, down,
+					right, up: the moves from cell are targets[offsets[cell]:offsets[cell+1]]
+	'''
+	def __init__(self,board):
+		self.offsets=array('i',[0])
+		self.targets=array('i')
+		for cell in range(board.m*board.n):
+			self.targets.extend(board.neighbours(cell))
+			self.offsets.append(len(self.targets))
+
+	def neighbours(self,cell):
+		return self.targets[self.offsets[cell]:self.offsets[cell+1]]
+
+
+_graphs=LRUCache()		# (m,n,passable) -> Graph
+
+
+def compiled(board):
+	'''
+		Returns the Graph of board. It is compiled once per Board and shared by every Board with the same size and
+		passable cells; the last cache.CACHE_SIZE graphs are kept.
+	'''
+	if board.graph!=None:
+		return board.graph
+
+	board.graph=_graphs.get((board.m,board.n,bytes(board.passable)),lambda: Graph(board))
+	return board.graph
+
+
+_work=LRUCache()		# (m,n,passable) of the boards not compiled yet -> [cells expanded by their searches so far]
+
+
+def adjacency(board):
+	'''
+		Returns the Graph of board for a search of it, or None if the search is to read the moves from the grid
+		(Board.neighbours) instead. Compiling a Graph costs about as much as expanding every cell once, which a
+		search touching a few cells never pays back, so the Graph is only compiled once the searches of the board
+		(or of any board with the same size and passable cells) have expanded as many cells as it has (see
+		searched). Local queries never compile, and a board flooded once is compiled for the next search.
+	'''
+	if board.graph!=None:
+		return board.graph
+	key=(board.m,board.n,bytes(board.passable))
+	if key in _graphs or (key in _work and _work.get(key,None)[0]>=board.m*board.n):
+		return compiled(board)
+	return None
+
+
+def searched(board,expanded):
+	'''
+		Adds expanded to the number of cells expanded by the searches of board, which adjacency weighs against the
+		cost of compiling it
+	'''
+	if board.graph==None:
+		_work.get((board.m,board.n,bytes(board.passable)),lambda: [0])[0]+=expanded
@@ -0,0 +1,70 @@
+'''
+	heuristics.py holds the estimates of the distance to the diamond the informed searches (bestfirst, astar,
+	idastar) can order their frontier list by.
+	A heuristic is a function heuristic(board) which returns the estimate h(cell) for that board, so that any
+	precomputation is done once per search rather than once per cell. Custom heuristics of the same form can be
+	passed wherever a heuristic name is accepted.
+'''
+
+from .landmarks import alt
+
+
+def manhattan(board):
+	'''
+		The number of moves to the diamond when nothing is in the way. A move changes x or y by one, so this never
+		overestimates and is the default.
+	'''
+	n=board.n
+	gx=board.goal//n
+	gy=board.goal%n
+	return lambda cell: abs(gx-cell//n)+abs(gy-cell%n)
+
+
+def chebyshev(board):
+	'''
+		The larger of the x and y distances to the diamond. It never overestimates either, but it is never larger
+		than manhattan, so it expands at least as many cells.
+	'''
+	n=board.n
+	gx=board.goal//n
+	gy=board.goal%n
+	return lambda cell: max(abs(gx-cell//n),abs(gy-cell%n))
+
+
+def zero(board):
+	'''
+		No estimate at all: astar becomes a uniform cost search and bestfirst becomes a search in insertion order
+	'''
+	return lambda cell: 0
+
+
+def weighted(w,base='manhattan'):
+	'''
+		Returns a heuristic which is w times the heuristic base. With w>1 it may overestimate, so astar trades the
+		guarantee of a shortest path for fewer expansions.
+	'''
+	def heuristic(board):
+		h=getHeuristic(base)(board)
+		return lambda cell: w*h(cell)
+	return heuristic
+
+
+HEURISTICS={
+	'manhattan':manhattan,
+	'chebyshev':chebyshev,
+	'zero':zero,
+	'weighted':weighted(2),
+	'alt':alt,
+}
+
+
+def getHeuristic(heuristic):
+	'''
+		Returns the heuristic registered under the name heuristic, or heuristic itself if it is already a function
+	'''
+	if callable(heuristic):
+		return heuristic
+	try:
+		return HEURISTICS[heuristic]
+	except KeyError:
+		raise ValueError('unknown heuristic %r' % (heuristic,))
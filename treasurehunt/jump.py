@@ -0,0 +1,141 @@
+'''
+	jump.py holds jump point search (JPS) for the four moves left, down, right and up.
+	On open regions A* pushes every neighbour of every cell, although most of the paths it builds are equally short
+	reorderings of the same moves. JPS only searches the paths which make their horizontal moves before their
+	vertical ones, and it jumps over the cells of straight runs where no such path can turn:
+		- a vertical run goes on until a cell to its left or right is open while the cell behind that one is not
+		  (a forced neighbour), or until the diamond
+		- a horizontal run stops at every cell from which a vertical run finds a jump point
+	The cells it stops at are the jump points; A* runs over them, with the length of every jump as its cost.
+'''
+
+from array import array
+
+from .frontier import OPEN,CLOSED,OpenList
+
+
+def jumpSearch(board,sources,strategy,trace=None,explored=None,origin=None,hfn=None):
+	'''
+		This function runs A* over the jump points reachable from the musketeer cells in sources, with the arguments
+		and result of engine.search. explored and trace hold jump points only; the path returned has every cell.
+	'''
+	m=board.m
+	n=board.n
+	goal=board.goal
+	gx=goal//n
+	gy=goal%n
+	grid=board.grid
+	stride=board.stride
+	size=m*n
+	deep=strategy.deep
+
+	status=bytearray(size)
+	parent=array('i',[-1])*size
+	gcost=array('i',[0])*size
+
+	def free(x,y):
+		# runs stop at the border of grid, so x and y never go further out than -1, m or n
+		return grid[(x+1)*stride+y+1]
+
+	def vertical(x,y,dx):
+		# follows the run from (x,y) in direction dx and returns the jump point it stops at, or -1
+		while 1:
+			x+=dx
+			if not free(x,y):
+				return -1
+			cell=x*n+y
+			if cell==goal:
+				return cell
+			if free(x,y-1) and not free(x-dx,y-1):
+				return cell
+			if free(x,y+1) and not free(x-dx,y+1):
+				return cell
+
+	def horizontal(x,y,dy):
+		while 1:
+			y+=dy
+			if not free(x,y):
+				return -1
+			cell=x*n+y
+			if cell==goal or vertical(x,y,-1)!=-1 or vertical(x,y,1)!=-1:
+				return cell
+
+	def successors(cell):
+		x=cell//n
+		y=cell%n
+		p=parent[cell]
+		if p==-1:
+			dirs=((0,-1),(1,0),(0,1),(-1,0))
+		else:
+			dx=(x>p//n)-(x<p//n)
+			dy=(y>p%n)-(y<p%n)
+			if dy!=0:
+				dirs=((0,dy),(1,0),(-1,0))
+			else:
+				dirs=[(dx,0)]
+				for side in (-1,1):
+					if free(x,y+side) and not free(x-dx,y+side):
+						dirs.append((0,side))
+		t=[]
+		for (dx,dy) in dirs:
+			if dx!=0:
+				j=vertical(x,y,dx)
+			else:
+				j=horizontal(x,y,dy)
+			if j!=-1:
+				t.append(j)
+		return t
+
+	fl=OpenList(trace)
+	for k in range(len(sources)):
+		start=sources[k]
+		h=hfn(start) if hfn!=None else abs(gx-start//n)+abs(gy-start%n)
+		fl.push(start,h,0)
+		status[start]=OPEN
+		if origin!=None:
+			origin[start]=k
+	expanded=0
+	en=-1
+	while not fl.empty():
+		en=fl.pop()
+		expanded+=1
+		if explored!=None:
+			explored.append(en)
+		status[en]=CLOSED
+		if en==goal:
+			break
+		for child in successors(en):
+			g=gcost[en]+abs(child//n-en//n)+abs(child%n-en%n)
+			if status[child]!=0 and not g<gcost[child]:
+				continue
+			h=hfn(child) if hfn!=None else abs(gx-child//n)+abs(gy-child%n)
+			fl.push(child,g+h,-g if deep else None)
+			gcost[child]=g
+			parent[child]=en
+			status[child]=OPEN
+			if origin!=None:
+				origin[child]=origin[en]
+		if trace!=None:
+			trace.endStep()
+	if trace!=None:
+		trace.endStep()
+
+	path=[]
+	if en==goal:
+		cell=goal
+		while cell!=-1:
+			p=parent[cell]
+			path.append([cell//n,cell%n])
+			if p!=-1:
+				# fill in the cells jumped over between p and cell
+				dx=(p//n>cell//n)-(p//n<cell//n)
+				dy=(p%n>cell%n)-(p%n<cell%n)
+				x=cell//n+dx
+				y=cell%n+dy
+				while x*n+y!=p:
+					path.append([x,y])
+					x+=dx
+					y+=dy
+			cell=p
+		path.reverse()
+	return (path,expanded,fl.pushed)
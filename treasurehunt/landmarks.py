@@ -0,0 +1,95 @@
+'''
+	landmarks.py holds the ALT (A*, landmarks and triangle inequality) heuristic. Exact distances from a few landmark
+	cells are computed once per board; for any landmark L, |d(L,goal)-d(L,cell)| never overestimates the distance
+	from cell to the diamond, and the largest of these bounds is usually much closer to it than manhattan distance.
+	The distances are taken on the board without its musketeers, so that one table serves every placement of them;
+	the musketeers only take cells away, which makes distances longer, so the bound stays admissible.
+'''
+
+from array import array
+from collections import deque
+
+from .cache import LRUCache
+from .graph import compiled
+
+LANDMARKS=4			# default number of landmarks
+
+
+def distancesFrom(board,source):
+	'''
+		Returns an array with the number of moves from source to every passable cell (-1 where it can not go)
+	'''
+	graph=compiled(board)
+	dist=array('i',[-1])*(board.m*board.n)
+	dist[source]=0
+	q=deque([source])
+	while q:
+		cell=q.popleft()
+		d=dist[cell]+1
+		for child in graph.neighbours(cell):
+			if dist[child]==-1:
+				dist[child]=d
+				q.append(child)
+	return dist
+
+
+class LandmarkTable:
+	'''
+		This class picks up to k landmarks in the region of the diamond of board and keeps the bound they give
+		where   landmarks is the list of landmark cells, picked farthest point first: the first is the cell
+					farthest from the diamond, every next one the cell farthest from all the landmarks so far
+				dist is the list of distance arrays, one per landmark
+				h is an array with the ALT bound of every cell, never below manhattan distance. Cells outside the
+					region of the diamond get manhattan distance.
+	'''
+	def __init__(self,board,k=LANDMARKS):
+		self.landmarks=[]
+		self.dist=[]
+		size=board.m*board.n
+		self.h=array('i',[board.heuristic(cell) for cell in range(size)])
+		goal=board.goal
+		fromGoal=distancesFrom(board,goal)
+		region=[cell for cell in range(size) if fromGoal[cell]!=-1]
+
+		nearest=fromGoal		# distance from every cell to the closest of the diamond and the landmarks so far
+		while len(self.landmarks)<k:
+			far=max(region,key=lambda cell: nearest[cell])
+			if nearest[far]==0:
+				break
+			dist=distancesFrom(board,far)
+			self.landmarks.append(far)
+			self.dist.append(dist)
+			nearest=array('i',[min(nearest[cell],dist[cell]) for cell in range(size)])
+
+		h=self.h
+		for dist in self.dist:
+			dgoal=dist[goal]
+			for cell in region:
+				bound=abs(dgoal-dist[cell])
+				if bound>h[cell]:
+					h[cell]=bound
+
+
+_tables=LRUCache()		# (m,n,goal,openCells,k) -> LandmarkTable
+
+
+def landmarkTable(board,k=LANDMARKS):
+	'''
+		Returns the LandmarkTable with k landmarks of board without its musketeers (see Board.withoutMusketeers),
+		reusing the one built for any earlier board with the same size, diamond and cells, wherever its musketeers
+		stood. The last cache.CACHE_SIZE tables are kept.
+	'''
+	key=(board.m,board.n,board.goal,bytes(board.openCells()),k)
+	return _tables.get(key,lambda: LandmarkTable(board.withoutMusketeers(),k))
+
+
+def landmarks(k=LANDMARKS):
+	'''
+		Returns the ALT heuristic with k landmarks
+	'''
+	def alt(board):
+		return landmarkTable(board,k).h.__getitem__
+	return alt
+
+
+alt=landmarks()
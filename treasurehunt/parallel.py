@@ -0,0 +1,68 @@
+'''
+	parallel.py runs the searches of one board in a pool of worker processes. The board is put once into shared
+	memory (a multiprocessing RawArray of its cell values) when the pool starts; every worker builds its Board from
+	it once and keeps it for all the searches it is given, so the tasks themselves only carry a musketeer cell.
+'''
+
+import multiprocessing
+from array import array
+
+from .board import Board
+
+_shared={'board':None}		# the Board of the worker process, built by attach
+
+
+def shareBoard(mat):
+	'''
+		Returns the board mat (list of lists) as a RawArray of its m*n cell values, in row order
+	'''
+	cells=array('b')
+	for row in mat:
+		cells.extend(row)
+	return multiprocessing.RawArray('b',cells.tolist())
+
+
+def attach(cells,m,n,prune):
+	'''
+		Builds the Board of the worker process from the shared cell values. Runs once in every worker.
+	'''
+	mat=[list(cells[x*n:(x+1)*n]) for x in range(m)]
+	_shared['board']=Board(mat,prune)
+
+
+def sharedBoard():
+	'''
+		Returns the Board of the worker process
+	'''
+	return _shared['board']
+
+
+def checkProcesses(processes):
+	'''
+		Raises ValueError unless processes is None, for no worker processes at all (everything runs in the calling
+		process), or a number of worker processes of at least 1
+	'''
+	if processes!=None and processes<1:
+		raise ValueError('processes must be at least 1, not %r' % (processes,))
+
+
+def mapBoard(function,mat,prune,tasks,processes):
+	'''
+		Runs function(task) for every task of the list tasks in a pool of up to processes worker processes, each
+		with the Board of mat (pruned if prune is True) available through sharedBoard, and returns the list of the
+		results in the order of tasks. processes must be at least 1.
+	'''
+	checkProcesses(processes)
+	if processes==None:
+		raise ValueError('mapBoard needs a number of worker processes')
+	cells=shareBoard(mat)
+	pool=multiprocessing.Pool(min(processes,len(tasks)),attach,(cells,len(mat),len(mat[0]),prune))
+	try:
+		results=pool.map(function,tasks,1)
+		pool.close()
+	except:
+		pool.terminate()
+		raise
+	finally:
+		pool.join()
+	return results
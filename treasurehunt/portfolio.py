@@ -0,0 +1,88 @@
+'''
+	portfolio.py races the searches of the algorithm directories against each other on one board. Every strategy
+	of the portfolio runs in its own worker process; the answer is the one of the first strategy to finish which
+	guarantees a shortest path, and the other workers are stopped. Which strategy won, and in how long, is logged to
+	the 'treasurehunt.portfolio' logger so that the choice of strategy can be tuned later.
+'''
+
+import logging
+import multiprocessing
+import time
+
+try:
+	from queue import Empty
+except ImportError:
+	from Queue import Empty
+
+from . import engine
+
+# the strategies of the Astar, BFS, BestFirstSearch, DFS and IDAstar directories, and whether each one always finds
+# a shortest path (with the default manhattan heuristic, which never overestimates)
+PORTFOLIO=[('astar',True),('bfs',True),('bestfirst',False),('dfs',False),('idastar',True)]
+
+POLL=0.1		# seconds between checks that the workers are still alive
+
+log=logging.getLogger(__name__)
+
+
+def work(results,strategy,mat,compact,multisource,prune):
+	'''
+		Runs in a worker process: puts (strategy,result,error) on the queue results, where result is what
+		engine.singleAgentSearch returns (None if it raised, error then being the message)
+	'''
+	try:
+		results.put((strategy,engine.singleAgentSearch(mat,strategy,compact,multisource,prune=prune),None))
+	except Exception as e:
+		results.put((strategy,None,repr(e)))
+
+
+def portfolioSearch(mat,compact=False,multisource=False,prune=False,portfolio=PORTFOLIO):
+	'''
+		This function runs every strategy of portfolio, a list of (strategy,optimal) pairs, on the board mat in
+		parallel and returns (exploredNodes,searchQueue,shortestPath,winner): the triple of engine.singleAgentSearch
+		from winner, the first strategy to finish with optimal set. The workers still running are then terminated.
+		Raises RuntimeError if every optimal strategy fails.
+	'''
+	optimal=dict(portfolio)
+	results=multiprocessing.Queue()
+	workers={}
+	start=time.time()
+	for (strategy,best) in portfolio:
+		worker=multiprocessing.Process(target=work,args=(results,strategy,mat,compact,multisource,prune))
+		worker.daemon=True
+		worker.start()
+		workers[strategy]=worker
+
+	pending=set(workers)
+	winner=None
+	dead=False
+	try:
+		while pending:
+			try:
+				(strategy,result,error)=results.get(True,POLL)
+			except Empty:
+				# a worker which died without a result (killed, out of memory) will never answer; a worker puts its
+				# result before it exits, so once all of them are gone one more wait is enough
+				if dead:
+					break
+				dead=not [s for s in pending if workers[s].is_alive()]
+				continue
+			pending.discard(strategy)
+			if error!=None:
+				log.warning('portfolio: %s failed: %s',strategy,error)
+			elif optimal[strategy]:
+				winner=strategy
+				break
+			else:
+				log.debug('portfolio: %s finished first but does not guarantee a shortest path',strategy)
+	finally:
+		for strategy in workers:
+			if workers[strategy].is_alive():
+				workers[strategy].terminate()
+			workers[strategy].join()
+
+	if winner==None:
+		raise RuntimeError('no optimal strategy of the portfolio finished')
+	log.info('portfolio: %s won on a %dx%d board in %.3f s, stopped %s',winner,len(mat),len(mat[0]),
+		time.time()-start,', '.join(sorted(pending)) or 'none')
+	return (result[0],result[1],result[2],winner)
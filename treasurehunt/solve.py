@@ -0,0 +1,110 @@
+'''
+	solve.py solves a corpus of boards without opening a window, spreading the boards over a pool of worker
+	processes, and writes one JSON object per board and line.
+
+	Usage:
+		python -m treasurehunt.solve boards... [--strategy S] [--heuristic H] [--multisource] [--prune]
+			[--processes P] [--output FILE]
+
+	Every argument in boards is a board file in the format of input.txt, a directory (its *.txt files are taken) or
+	a glob pattern. The lines are written in the order of the boards, each with the file, the strategy, the length
+	(number of moves) and path of the shortest path found (-1 and [] if there is none), the nodes expanded and
+	generated and the time taken, or with the error met reading or solving the board.
+'''
+
+from __future__ import print_function
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from . import engine
+from .board import readBoard
+from .heuristics import HEURISTICS
+
+
+def boardFiles(args):
+	'''
+		Returns the board files named by the list args of files, directories and glob patterns, without repeats
+	'''
+	files=[]
+	for arg in args:
+		if os.path.isdir(arg):
+			found=sorted(glob.glob(os.path.join(arg,'*.txt')))
+		else:
+			found=sorted(glob.glob(arg)) or [arg]
+		for path in found:
+			if path not in files:
+				files.append(path)
+	return files
+
+
+def solveFile(job):
+	'''
+		Solves the board in the file of job, a (path,strategy,heuristic,multisource,prune) tuple, and returns the
+		result line as a dict. Runs in the worker processes.
+	'''
+	(path,strategy,heuristic,multisource,prune)=job
+	result={'file':path,'strategy':strategy}
+	try:
+		board=readBoard(path)
+	except (IOError,ValueError) as e:
+		result['error']=str(e)
+		return result
+	if board==[]:
+		result['error']='empty board'
+		return result
+	start=time.time()
+	try:
+		(shortestPath,stats)=engine.findShortestPath(board,strategy,multisource,heuristic,prune)
+	except Exception as e:
+		# one board the engine can not handle must not stop the others
+		result['error']=repr(e)
+		return result
+	result['seconds']=round(time.time()-start,6)
+	result['length']=len(shortestPath)-1 if shortestPath!=[] else -1
+	result['path']=shortestPath
+	result['expanded']=stats['expanded']
+	result['generated']=stats['generated']
+	return result
+
+
+def main(argv=None):
+	parser=argparse.ArgumentParser(description='Solve board files in parallel and write the results as JSON lines')
+	parser.add_argument('boards',nargs='+',help='board files, directories of *.txt board files or glob patterns')
+	parser.add_argument('--strategy',default='bfs',choices=sorted(engine.STRATEGIES),help='search strategy')
+	parser.add_argument('--heuristic',default='manhattan',choices=sorted(HEURISTICS),
+		help='heuristic of the informed strategies')
+	parser.add_argument('--multisource',action='store_true',help='search from all musketeers in one pass')
+	parser.add_argument('--prune',action='store_true',help='remove dead ends before searching')
+	parser.add_argument('--processes',type=int,default=multiprocessing.cpu_count(),
+		help='number of worker processes (all cores by default)')
+	parser.add_argument('--output',default=None,help='file to write the results to (standard output by default)')
+	args=parser.parse_args(argv)
+	if args.processes<1:
+		parser.error('--processes must be at least 1')
+
+	jobs=[(path,args.strategy,args.heuristic,args.multisource,args.prune) for path in boardFiles(args.boards)]
+	out=open(args.output,'w') if args.output else sys.stdout
+	pool=multiprocessing.Pool(args.processes)
+	try:
+		# imap keeps the order of the boards; chunks keep the pool busy without a round trip per small board
+		chunk=max(1,len(jobs)//(4*args.processes))
+		for result in pool.imap(solveFile,jobs,chunk):
+			out.write(json.dumps(result,sort_keys=True)+'\n')
+		pool.close()
+	except:
+		pool.terminate()
+		raise
+	finally:
+		pool.join()
+		if out is not sys.stdout:
+			out.close()
+
+
+if __name__=='__main__':
+	main()
@@ -0,0 +1,117 @@
+'''
+	trace.py holds SearchTrace, the compact searchQueue recorded by the search engine.
+'''
+
+from array import array
+
+
+class SearchTrace:
+	'''
+		This is a compact record of the frontier list after every iteration of the search. Instead of a full copy of
+		the frontier per iteration, it stores the cells pushed to and popped from the frontier during each step, and
+		a full keyframe of the frontier every keyframe steps so that any step can be rebuilt quickly.
+		It can be used in place of the searchQueue list of lists: len(trace) is the number of iterations and trace[i]
+		is the frontier after iteration i as a list of [x,y], oldest first.
+		A cell pushed again while it is in the frontier is listed once; it leaves the frontier when it has been
+		popped as many times as it was pushed.
+	'''
+	def __init__(self,n,keyframe=64):
+		self.n=n						# width of the board, cells are stored as x*n+y
+		self.keyframe=keyframe
+		self.events=array('i')			# cell for a push, -cell-1 for a pop
+		self.offsets=array('i',[0])		# events of step i are events[offsets[i]:offsets[i+1]]
+		self.frames=[array('i')]		# frames[j] is the frontier before step j*keyframe, oldest first
+		self.live={}					# cell -> insertion number of every cell in the frontier right now
+		self.extra={}					# cell -> number of pushes beyond the first of the cells in the frontier twice
+		self.seq=0
+
+	def push(self,cell):
+		if cell in self.live:
+			self.extra[cell]=self.extra.get(cell,0)+1
+			return
+		self.events.append(cell)
+		self.live[cell]=self.seq
+		self.seq+=1
+
+	def pop(self,cell):
+		if cell in self.extra:
+			if self.extra[cell]==1:
+				del self.extra[cell]
+			else:
+				self.extra[cell]-=1
+			return
+		self.events.append(-cell-1)
+		del self.live[cell]
+
+	def endStep(self):
+		'''
+			Closes the current step; the frontier it records is the one the search holds right now
+		'''
+		self.offsets.append(len(self.events))
+		if (len(self.offsets)-1)%self.keyframe==0:
+			live=self.live
+			self.frames.append(array('i',sorted(live,key=live.get)))
+
+	def __len__(self):
+		return len(self.offsets)-1
+
+	def __getitem__(self,i):
+		'''
+			Rebuilds the frontier after step i from the nearest keyframe before it
+		'''
+		if i<0:
+			i+=len(self)
+		if i<0 or i>=len(self):
+			raise IndexError('trace step out of range')
+		j=i//self.keyframe
+		pos={}
+		for cell in self.frames[j]:
+			pos[cell]=len(pos)
+		self.replay(pos,len(pos),self.offsets[j*self.keyframe],self.offsets[i+1])
+		return self.cells(pos)
+
+	def __iter__(self):
+		'''
+			Yields the frontier after every step in order, replaying each event once
+		'''
+		pos={}
+		seq=0
+		for i in range(len(self)):
+			seq=self.replay(pos,seq,self.offsets[i],self.offsets[i+1])
+			yield self.cells(pos)
+
+	def restrict(self,keep,explored,steps=None):
+		'''
+			Returns a new SearchTrace with only the events of the cells for which keep[cell] is set, where explored
+			holds the cell expanded at every step. A step whose expanded cell is not kept is merged into the next one
+			that is, so the steps still line up with the explored cells kept; events after the last step kept are left
+			out. With steps, step i is kept if steps[i] is set instead, and only the events of the steps kept count,
+			but for the cells whose keep is 2, whose events are kept in any step.
+		'''
+		t=SearchTrace(self.n,self.keyframe)
+		for i in range(len(self)):
+			kept=steps[i] if steps!=None else i<len(explored) and keep[explored[i]]
+			for e in self.events[self.offsets[i]:self.offsets[i+1]]:
+				cell=e if e>=0 else -e-1
+				if keep[cell]==2 or (keep[cell] and (steps==None or kept)):
+					if e>=0:
+						t.push(e)
+					else:
+						t.pop(cell)
+			if kept:
+				t.endStep()
+		del t.events[t.offsets[-1]:]
+		return t
+
+	def replay(self,pos,seq,lo,hi):
+		for e in self.events[lo:hi]:
+			if e>=0:
+				pos[e]=seq
+				seq+=1
+			else:
+				del pos[-e-1]
+		return seq
+
+	def cells(self,pos):
+		n=self.n
+		return [[cell//n,cell%n] for cell in sorted(pos,key=pos.get)]
@@ -0,0 +1,131 @@
+'''
+	wavefront.py holds a breadth first search which advances a whole layer of the search at once with NumPy: the
+	frontier and the visited cells are boolean arrays over the board, and the next layer is the frontier shifted
+	one cell left, down, right and up, restricted to passable cells not visited yet.
+	Every layer costs a pass over the whole board, so this pays off on open boards, where the layers are wide, and
+	not on long narrow mazes, where corridor.py is the better choice.
+	NumPy is optional; without it the rest of the package works and only this search raises ImportError.
+'''
+
+try:
+	import numpy
+except ImportError:
+	numpy=None
+
+
+def layers(board,sources,origin=None):
+	'''
+		This function runs the wavefront from the musketeer cells in sources until the layer holding the diamond or
+		until nothing new is reached. It returns (wave,dist) where wave[d] is the array of the cells d moves away from
+		the nearest source, in increasing order, and dist is an (m,n) array with that number for every cell reached
+		(-1 elsewhere). If given, the array origin gets the index in sources of the source every cell was reached from.
+	'''
+	if numpy==None:
+		raise ImportError('the wavefront search needs numpy')
+
+	m=board.m
+	n=board.n
+	# the masks are bordered by a row and a column of blocked cells on every side, so a shift never wraps around
+	free=numpy.zeros((m+2,n+2),dtype=bool)
+	free[1:-1,1:-1]=numpy.frombuffer(bytes(board.passable),dtype=numpy.uint8).reshape(m,n)!=0
+	inner=(slice(1,-1),slice(1,-1))
+	dist=numpy.full((m,n),-1,dtype=numpy.int32)
+	frontier=numpy.zeros((m+2,n+2),dtype=bool)
+	for start in sources:
+		frontier[start//n+1,start%n+1]=True
+		dist[start//n,start%n]=0
+	label=None
+	if origin!=None:
+		label=numpy.full((m+2,n+2),-1,dtype=numpy.int32)
+		for k in range(len(sources)):
+			label[sources[k]//n+1,sources[k]%n+1]=k
+	# the neighbour every cell looks at for the moves left, down, right and up into it
+	shifts=((slice(1,-1),slice(2,None)),(slice(None,-2),slice(1,-1)),(slice(1,-1),slice(None,-2)),
+		(slice(2,None),slice(1,-1)))
+
+	gx=board.goal//n
+	gy=board.goal%n
+	wave=[numpy.flatnonzero(frontier[inner])]
+	nxt=numpy.zeros((m,n),dtype=bool)
+	d=0
+	while dist[gx,gy]==-1:
+		nxt[...]=False
+		for shift in shifts:
+			nxt|=frontier[shift]
+		nxt&=free[inner]
+		free[inner]&=~nxt		# a cell reached is never entered again
+		cells=numpy.flatnonzero(nxt)
+		if len(cells)==0:
+			break
+		d+=1
+		dist.flat[cells]=d
+		if label is not None:
+			# every new cell takes the label of the first neighbour in the last layer, in the order above
+			new=label[inner]
+			for shift in shifts:
+				take=nxt&frontier[shift]&(new==-1)
+				new[take]=label[shift][take]
+		frontier[inner]=nxt
+		wave.append(cells)
+
+	if label is not None:
+		for cell in numpy.flatnonzero(label[inner]!=-1):
+			origin[cell]=int(label[inner].flat[cell])
+	return (wave,dist)
+
+
+def wavefrontSearch(board,sources,strategy,trace=None,explored=None,origin=None,hfn=None):
+	'''
+		This function runs the wavefront from the musketeer cells in sources, with the arguments and result of
+		engine.search (hfn is not used). All sources start in the first layer, so the path is the shortest from any
+		of them. Recording walks the layers in order as a queue based search would pop them: the frontier at every
+		step is the rest of the current layer followed by the whole next one.
+	'''
+	goal=board.goal
+	(wave,dist)=layers(board,sources,origin)
+	found=dist.flat[goal]!=-1
+
+	# the cells popped: every layer before the diamond's, and the diamond's up to the diamond
+	cells=list(wave)
+	if found:
+		cells[-1]=wave[-1][:numpy.searchsorted(wave[-1],goal)+1]
+	expanded=sum([len(c) for c in cells])
+	generated=sum([len(c) for c in wave])
+
+	if trace!=None or explored!=None:
+		for d in range(len(cells)):
+			layer=cells[d].tolist()
+			if explored!=None:
+				explored.extend(layer)
+			if trace!=None:
+				if d==0:
+					for cell in wave[0].tolist():
+						trace.push(cell)
+				for i in range(len(layer)):
+					trace.pop(layer[i])
+					if i==0 and d+1<len(wave):
+						for child in wave[d+1].tolist():
+							trace.push(child)
+					trace.endStep()
+
+	return (walkBack(dist,goal),expanded,generated)
+
+
+def walkBack(dist,goal):
+	'''
+		Returns the path from a musketeer to the cell goal given the (m,n) array dist of one board from layers ([] if
+		goal was not reached), every step back going to the first neighbour (left, down, right, up) one move closer
+	'''
+	(m,n)=dist.shape
+	if goal==-1 or dist.flat[goal]==-1:
+		return []
+	(x,y)=divmod(goal,n)
+	path=[[x,y]]
+	for d in range(int(dist[x,y])-1,-1,-1):
+		for (cx,cy) in ((x,y-1),(x+1,y),(x,y+1),(x-1,y)):
+			if 0<=cx<m and 0<=cy<n and dist[cx,cy]==d:
+				(x,y)=(cx,cy)
+				break
+		path.append([x,y])
+	path.reverse()
+	return path